@@ -0,0 +1,29 @@
+"""
+Run the agent tool-calling test scripts back to back on one event loop.
+
+Sharing the loop keeps the MongoDB client (get_agent_deps) and warm
+HTTP connections alive between the scripts instead of tearing them
+down after each one.
+
+Usage:
+    uv run python run_agent_tests.py
+"""
+import asyncio
+
+import test_force_tools
+import test_research_direct
+import test_tool_calling
+
+SCRIPTS = [test_force_tools, test_research_direct, test_tool_calling]
+
+def main():
+    with asyncio.Runner() as runner:
+        for script in SCRIPTS:
+            print("=" * 60)
+            print(script.__name__)
+            print("=" * 60)
+            runner.run(script.main(script.QUERIES))
+            print()
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.ingestion.contact_info import ContactInfoIngester
+from src.ingestion.http_client import close_http_client
 
 
 async def enrich_contact_info():
@@ -28,6 +29,7 @@ async def enrich_contact_info():
     
     ingester = ContactInfoIngester()
     stats = await ingester.run_enrichment()
+    await close_http_client()
     
     print("\n✅ Enrichment Complete!")
     print("=" * 60)
@@ -28,6 +28,7 @@ from src.ingestion.congress_bills import CongressBillsIngester
 from src.ingestion.committees import CommitteeIngester
 from src.ingestion.votes import VotesIngester
 from src.ingestion.fec import FECIngester
+from src.ingestion.http_client import close_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -448,6 +449,9 @@ async def run_all_pipelines(
             print(f"\n❌ Pipeline '{name}' FAILED: {e}")
             all_stats[name] = {"error": str(e)}
     
+    # Pipelines share one HTTP connection pool; close it once at the end
+    await close_http_client()
+    
     # Final summary
     end_time = datetime.now(timezone.utc)
     duration = end_time - start_time
@@ -9,6 +9,7 @@ Usage:
     uv run python scripts/sync_bills.py --type hr          # Just House bills
     uv run python scripts/sync_bills.py --max 500          # Fetch 500 bills
     uv run python scripts/sync_bills.py --congress 118     # Different Congress
+    uv run python scripts/sync_bills.py --bootstrap        # First sync into an empty collection
 """
 import asyncio
 import logging
@@ -19,13 +20,15 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.ingestion.congress_bills import CongressBillsIngester
+from src.ingestion.http_client import close_http_client
 from src.config.constants import CURRENT_CONGRESS
 
 
 async def sync_bills(
     congress: int = CURRENT_CONGRESS,
     bill_types: list = None,
-    max_bills_per_type: int = 100):
+    max_bills_per_type: int = 100,
+    bootstrap: bool = False):
     """
     Sync bills from Congress.gov.
     
@@ -33,6 +36,7 @@ async def sync_bills(
         congress: Congress number
         bill_types: List of bill types to sync
         max_bills_per_type: Max bills to fetch per type
+        bootstrap: Use insert_many instead of upserts (empty collection only)
     """
     if bill_types is None:
         bill_types = ["hr", "s"]  # House and Senate bills only by default
@@ -57,7 +61,7 @@ async def sync_bills(
         # ✨ FIX: Create a NEW ingester for each bill type
         # This ensures each bill type gets a fresh database connection
         # and avoids "Cannot use MongoClient after close" error
-        ingester = CongressBillsIngester(congress=congress)
+        ingester = CongressBillsIngester(congress=congress, bootstrap_mode=bootstrap)
         
         stats = await ingester.run(
             bill_type=bill_type,
@@ -72,6 +76,9 @@ async def sync_bills(
         
         # Note: No need to reset_stats() since we create fresh ingester each time
     
+    # The HTTP connection pool is shared by all bill types; close it once
+    await close_http_client()
+    
     print("\n" + "=" * 60)
     print("✅ All Bill Types Complete!")
     print("=" * 60)
@@ -114,6 +121,11 @@ async def main():
         action="store_true",
         help="Sync all bill types (hr, s, hres, sres, hjres, sjres, hconres, sconres)"
     )
+    parser.add_argument(
+        "--bootstrap",
+        action="store_true",
+        help="Initial load into an EMPTY legislation collection: insert instead of upsert"
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -141,7 +153,8 @@ async def main():
         stats = await sync_bills(
             congress=args.congress,
             bill_types=bill_types,
-            max_bills_per_type=args.max
+            max_bills_per_type=args.max,
+            bootstrap=args.bootstrap
         )
         
         # Exit with error code if there were errors
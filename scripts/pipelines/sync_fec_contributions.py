@@ -26,6 +26,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from motor.motor_asyncio import AsyncIOMotorClient
 from src.ingestion.fec import FECIngester
+from src.ingestion.http_client import close_http_client
 from src.config.settings import settings
 
 
@@ -215,6 +216,9 @@ async def sync_all_contributions(
             # Rate limiting between requests
             await asyncio.sleep(0.5)
     
+    # All politicians share one FEC connection pool; close it once
+    await close_http_client()
+    
     # Summary
     print("\n" + "=" * 60)
     print("✅ SYNC COMPLETE")
@@ -19,6 +19,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.ingestion.congress_members import CongressMembersIngester
+from src.ingestion.http_client import close_http_client
 from src.config.constants import CURRENT_CONGRESS
 
 
@@ -56,6 +57,7 @@ async def sync_members(
     
     # Run sync
     stats = await ingester.run_full_sync()
+    await close_http_client()
     
     print("\n✅ Sync Complete!")
     print("=" * 60)
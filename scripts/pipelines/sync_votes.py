@@ -16,6 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import the actual class name from votes.py
 from src.ingestion.votes import VotesIngester
+from src.ingestion.http_client import close_http_client
 from src.config.constants import CURRENT_CONGRESS
 
 async def sync_votes(
@@ -63,6 +64,8 @@ async def sync_votes(
             logging.error(f"Error syncing {chamber}: {str(e)}")
             total_stats["errors"] += 1
     
+    await close_http_client()
+    
     print("\n" + "=" * 60)
     print("✅ All Chambers Complete!")
     print("=" * 60)
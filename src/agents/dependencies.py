@@ -3,8 +3,10 @@ Agent dependencies - provides database and other resources to agent tools.
 
 This follows the Pydantic AI pattern for dependency injection.
 """
+import asyncio
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -18,20 +20,34 @@ class AgentDependencies:
     db: AsyncIOMotorDatabase
 
 
+# Shared dependencies for the running event loop (Motor clients are
+# bound to the loop they were first used on)
+_agent_deps: Optional[AgentDependencies] = None
+_agent_deps_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
 async def get_agent_deps() -> AgentDependencies:
     """
-    Factory function to create agent dependencies.
+    Get the shared agent dependencies, creating them on first use.
     
     This would typically be called when initializing the agent
-    or handling an API request.
+    or handling an API request. Repeated calls on the same event loop
+    reuse one MongoDB client (and its connection pool); a new event
+    loop gets fresh dependencies.
     
     Returns:
         AgentDependencies with database connection
     """
-    from motor.motor_asyncio import AsyncIOMotorClient
-    from src.config.settings import settings
-    
-    client = AsyncIOMotorClient(settings.MONGODB_URI)
-    db = client[settings.MONGODB_DATABASE]
+    global _agent_deps, _agent_deps_loop
+    loop = asyncio.get_running_loop()
+    if _agent_deps is None or _agent_deps_loop is not loop:
+        from motor.motor_asyncio import AsyncIOMotorClient
+        from src.config.settings import settings
+        
+        client = AsyncIOMotorClient(settings.MONGODB_URI)
+        db = client[settings.MONGODB_DATABASE]
+        
+        _agent_deps = AgentDependencies(db=db)
+        _agent_deps_loop = loop
     
-    return AgentDependencies(db=db)
+    return _agent_deps
@@ -0,0 +1,48 @@
+"""
+Helpers for inspecting Pydantic AI run results.
+
+Usage:
+    messages = run_messages(result)  # bind once, reuse for debugging
+    tool_calls = extract_tool_calls(messages)
+"""
+from operator import attrgetter
+
+# Message part kinds that are tool calls
+_TOOL_KINDS = frozenset({'tool-call'})
+
+# Every tool-call part has tool_name, so no default is needed
+_tool_name = attrgetter('tool_name')
+
+
+def run_messages(result) -> list:
+    """
+    All messages of an agent run, as a list.
+    
+    all_messages() builds its list on every call (and may be missing on
+    some result types), so call this once and reuse the list.
+    
+    Args:
+        result: Result of agent.run()
+        
+    Returns:
+        Message list ([] if the result has no messages)
+    """
+    return list(getattr(result, 'all_messages', lambda: ())())
+
+
+def extract_tool_calls(messages: list) -> list[str]:
+    """
+    Names of the tools called during an agent run, in call order.
+    
+    Args:
+        messages: Messages from run_messages()
+        
+    Returns:
+        Tool names (repeated if a tool was called more than once)
+    """
+    return [
+        _tool_name(part)
+        for msg in messages
+        for part in getattr(msg, 'parts', ())
+        if getattr(part, 'part_kind', None) in _TOOL_KINDS
+    ]
@@ -65,8 +65,12 @@ OPENSECRETS_INDUSTRIES = {
     "W": "Other",
 }
 
+# Local cache for HTTP responses (conditional GETs)
+HTTP_CACHE_DIR = ".cache"
+
 # Rate Limiting
 CONGRESS_GOV_RATE_LIMIT = 5000  # requests per hour
+FEC_RATE_LIMIT = 1000  # requests per hour
 REQUESTS_PER_SECOND = 1.4  # To stay under rate limit
 RATE_LIMIT_DELAY = 0.2  # seconds between requests
 
@@ -87,6 +87,17 @@ def create_politicians_indexes_sync(db: Database):
         name="idx_state_office"
     )
     
+    collection.create_index(
+        [
+            ("chamber", ASCENDING),
+            ("in_office", ASCENDING),
+            ("state", ASCENDING),
+            ("district", ASCENDING),
+            ("bioguide_id", ASCENDING)
+        ],
+        name="idx_house_seats"
+    )
+    
     collection.create_index(
         [("last_name", ASCENDING), ("first_name", ASCENDING)],
         name="idx_name_sort"
@@ -174,6 +185,12 @@ def create_contributions_indexes_sync(db: Database):
     
     logger.info("Creating contributions indexes...")
     
+    collection.create_index(
+        [("id", ASCENDING)],
+        unique=True,
+        name="idx_contribution_id"
+    )
+    
     collection.create_index(
         [
             ("bioguide_id", ASCENDING),
@@ -424,6 +441,18 @@ async def create_politicians_indexes(db: 'AsyncIOMotorDatabase'):
         name="idx_state_office"
     )
     
+    # Covering index for the member sync's in-office House roster
+    await collection.create_index(
+        [
+            ("chamber", ASCENDING),
+            ("in_office", ASCENDING),
+            ("state", ASCENDING),
+            ("district", ASCENDING),
+            ("bioguide_id", ASCENDING)
+        ],
+        name="idx_house_seats"
+    )
+    
     # Index for sorting by last name
     await collection.create_index(
         [("last_name", ASCENDING), ("first_name", ASCENDING)],
@@ -540,6 +569,13 @@ async def create_contributions_indexes(db: AsyncIOMotorDatabase):
     
     logger.info("Creating contributions indexes...")
     
+    # Unique index on contribution id (upsert key)
+    await collection.create_index(
+        [("id", ASCENDING)],
+        unique=True,
+        name="idx_contribution_id"
+    )
+    
     # Compound index for politician + cycle (most common query)
     await collection.create_index(
         [
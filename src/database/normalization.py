@@ -42,6 +42,19 @@ STATE_NAME_TO_CODE = {
 # Reverse mapping for validation
 STATE_CODE_TO_NAME = {v: k for k, v in STATE_NAME_TO_CODE.items()}
 
+# Other names the source APIs use (Congress.gov rosters say "Virgin Islands")
+STATE_NAME_ALIASES = {
+    "Virgin Islands": "VI", "US Virgin Islands": "VI",
+    "Commonwealth of the Northern Mariana Islands": "MP",
+    "Washington, D.C.": "DC", "Washington DC": "DC",
+}
+
+# Case-insensitive name lookup, aliases included
+_STATE_NAME_LOOKUP = {
+    name.lower(): code
+    for name, code in {**STATE_NAME_TO_CODE, **STATE_NAME_ALIASES}.items()
+}
+
 
 def normalize_state(state: Optional[str]) -> Optional[str]:
     """
@@ -76,17 +89,8 @@ def normalize_state(state: Optional[str]) -> Optional[str]:
             return code
         return None
     
-    # Full state name?
-    if state_clean in STATE_NAME_TO_CODE:
-        return STATE_NAME_TO_CODE[state_clean]
-    
-    # Try case-insensitive match
-    for full_name, code in STATE_NAME_TO_CODE.items():
-        if full_name.lower() == state_clean.lower():
-            return code
-    
-    # Invalid state
-    return None
+    # Full state name or alias (case-insensitive); None if invalid
+    return _STATE_NAME_LOOKUP.get(state_clean.lower())
 
 
 # ============================================================================
@@ -4,29 +4,81 @@ Base ingester class with fixed connection management.
 The key fix: Ensure all async operations complete before disconnecting.
 """
 from abc import ABC, abstractmethod
+import asyncio
+import hashlib
+import json
 from typing import AsyncGenerator, TypeVar, Generic, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
 import logging
 
 from src.config.settings import settings
 
 T = TypeVar('T')
 
+# MongoDB duplicate key error code
+DUPLICATE_KEY_ERROR = 11000
+
+# Document fields left out of content hashes
+_UNHASHED_FIELDS = frozenset({"_id", "_doc_hash", "last_updated"})
+
+
+def content_hash(document: dict) -> str:
+    """
+    Stable hash of a document's content, for skipping no-op writes.
+    
+    last_updated (and the stored hash itself) are ignored, so a record
+    that only got a new timestamp hashes the same.
+    
+    Args:
+        document: Document about to be written
+        
+    Returns:
+        Hex digest (blake2b, 16 bytes)
+    """
+    content = {k: v for k, v in document.items() if k not in _UNHASHED_FIELDS}
+    encoded = json.dumps(content, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
 
 class BaseIngester(ABC, Generic[T]):
     """
     Base class for all data ingesters with proper async connection handling.
+    
+    Subclasses can either write each item directly in load() or queue
+    pymongo write operations with queue_write(), which are sent to MongoDB
+    in bulk_write batches of batch_size.
     """
     
+    # Queued write operations per collection before a bulk_write is issued
+    batch_size: int = 500
+    
+    # Tasks running process_item() concurrently while fetch_data() keeps
+    # fetching; 1 keeps items in order but still overlaps fetch and load
+    pipeline_workers: int = 1
+    
+    # Index creators from src.database.indexes run by connect(); subclasses
+    # using queue_upsert_if_changed() must list the ones giving its key a
+    # unique index
+    required_indexes: tuple = ()
+    
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.client: Optional[AsyncIOMotorClient] = None
         self.db: Optional[AsyncIOMotorDatabase] = None
+        self._pending_writes: dict[str, list] = {}
+        self._pending_items: dict[str, int] = {}
+        # Per collection: op index -> key fields of hash-guarded upserts
+        self._hash_guarded: dict[str, dict[int, frozenset]] = {}
+        self._batch_timestamp: Optional[datetime] = None
+        self._indexes_ready = False
         self.stats = {
             "processed": 0,
             "inserted": 0,
             "updated": 0,
+            "unchanged": 0,
             "errors": 0,
             "started_at": None,
             "completed_at": None
@@ -34,14 +86,32 @@ class BaseIngester(ABC, Generic[T]):
     
     async def connect(self):
         """
-        Initialize database connection.
+        Initialize database connection and ensure required_indexes.
         
         Override this if you need custom connection logic.
+        
+        Raises:
+            RuntimeError: If a required index can't be created; guarded
+                upserts would insert duplicates without it
         """
         if self.db is None:
             self.client = AsyncIOMotorClient(settings.MONGODB_URI)
             self.db = self.client[settings.MONGODB_DATABASE]
             self.logger.info(f"Connected to MongoDB: {settings.MONGODB_DATABASE}")
+        
+        if self._indexes_ready:
+            return
+        
+        try:
+            for create_indexes in self.required_indexes:
+                await create_indexes(self.db)
+        except OperationFailure as e:
+            self.logger.error(f"Could not ensure required indexes: {e}")
+            raise RuntimeError(
+                f"{self.__class__.__name__} needs its unique indexes; "
+                f"refusing to run without them"
+            ) from e
+        self._indexes_ready = True
     
     async def disconnect(self):
         """Close database connection"""
@@ -78,7 +148,7 @@ class BaseIngester(ABC, Generic[T]):
         pass
     
     @abstractmethod
-    async def load(self, item: T) -> bool:
+    async def load(self, item: T) -> Optional[bool]:
         """
         Load item into database (upsert).
         
@@ -86,10 +156,128 @@ class BaseIngester(ABC, Generic[T]):
             item: Transformed data item
             
         Returns:
-            True if new insert, False if update
+            True if new insert, False if update, None if the write was
+            queued with queue_write() (counted when the batch is flushed)
         """
         pass
     
+    async def queue_write(self, collection_name: str, operation, is_item: bool = True):
+        """
+        Queue a write operation for a batched bulk_write.
+        
+        The batch for a collection is flushed automatically once it
+        reaches batch_size operations.
+        
+        Args:
+            collection_name: Name of the target collection
+            operation: pymongo write operation (UpdateOne, UpdateMany, ...)
+            is_item: True if this is the upsert for an ingested item and
+                     should count towards inserted/updated stats
+        """
+        ops = self._pending_writes.setdefault(collection_name, [])
+        ops.append(operation)
+        if is_item:
+            self._pending_items[collection_name] = self._pending_items.get(collection_name, 0) + 1
+        
+        if len(ops) >= self.batch_size:
+            await self.flush_writes(collection_name)
+    
+    async def queue_upsert_if_changed(self, collection_name: str, key: dict, document: dict):
+        """
+        Queue an upsert that MongoDB skips when the content is unchanged.
+        
+        The document's content hash is stored in _doc_hash and the filter
+        only matches when the stored hash differs, so re-syncing identical
+        data causes no write. For an unchanged document the upsert then
+        hits the unique index on the key and reports a duplicate key
+        error, which flush_writes() counts as "unchanged" (a duplicate on
+        any other unique index counts as an error). The key fields
+        must therefore have a unique index: list its creator in
+        required_indexes so connect() ensures it (without one, every
+        unchanged re-sync would insert a duplicate).
+        
+        Args:
+            collection_name: Name of the target collection
+            key: Filter identifying the document (e.g. {"bill_id": ...})
+            document: Full document for $set (gets _doc_hash added)
+        """
+        doc_hash = content_hash(document)
+        document["_doc_hash"] = doc_hash
+        
+        ops = self._pending_writes.setdefault(collection_name, [])
+        self._hash_guarded.setdefault(collection_name, {})[len(ops)] = frozenset(key)
+        await self.queue_write(
+            collection_name,
+            UpdateOne({**key, "_doc_hash": {"$ne": doc_hash}}, {"$set": document}, upsert=True)
+        )
+    
+    def batch_timestamp(self) -> datetime:
+        """
+        Timestamp shared by every record in the current write batch.
+        
+        Use this for last_updated fields instead of calling utcnow() per
+        record. A new timestamp is taken after each flush.
+        
+        Returns:
+            Naive UTC datetime (same form as datetime.utcnow())
+        """
+        if self._batch_timestamp is None:
+            self._batch_timestamp = datetime.now(timezone.utc).replace(tzinfo=None)
+        return self._batch_timestamp
+    
+    async def flush_writes(self, collection_name: Optional[str] = None):
+        """
+        Send queued write operations to MongoDB with unordered bulk_write.
+        
+        Args:
+            collection_name: Collection to flush (None = all collections)
+        """
+        names = [collection_name] if collection_name else list(self._pending_writes)
+        self._batch_timestamp = None
+        
+        for name in names:
+            ops = self._pending_writes.pop(name, [])
+            items = self._pending_items.pop(name, 0)
+            guarded = self._hash_guarded.pop(name, {})
+            if not ops:
+                continue
+            
+            failed = 0
+            try:
+                result = await self.db[name].bulk_write(ops, ordered=False)
+                upserted = result.upserted_count
+                modified = result.modified_count
+            except BulkWriteError as e:
+                # Unordered: everything except the reported failures was applied
+                upserted = e.details.get("nUpserted", 0)
+                modified = e.details.get("nModified", 0)
+                for error in e.details.get("writeErrors", []):
+                    # A duplicate on a hash-guarded upsert's own key means
+                    # "unchanged"; one on any other unique index is a conflict
+                    key = guarded.get(error.get("index"))
+                    unchanged = (
+                        key is not None
+                        and error.get("code") == DUPLICATE_KEY_ERROR
+                        and frozenset(error.get("keyPattern", ())) == key
+                    )
+                    if not unchanged:
+                        failed += 1
+                if failed:
+                    self.logger.error(f"Bulk write to {name} had {failed} failed operation(s)")
+                    self.stats["errors"] += failed
+            
+            # Only item ops count; upserts queued with is_item=False (e.g.
+            # vote member positions) don't. Items that were neither
+            # inserted, modified nor failed matched identical data, no
+            # document, or a hash guard
+            inserted = min(upserted, items)
+            applied = max(items - inserted - failed, 0)
+            updated = min(modified, applied)
+            self.stats["inserted"] += inserted
+            self.stats["updated"] += updated
+            self.stats["unchanged"] += applied - updated
+            self.logger.debug(f"Flushed {len(ops)} write(s) to {name}")
+    
     async def process_item(self, raw_item: dict):
         """
         Process a single item through the ETL pipeline.
@@ -106,7 +294,10 @@ class BaseIngester(ABC, Generic[T]):
             # Load (and wait for it to complete!)
             was_insert = await self.load(item)
             
-            if was_insert:
+            if was_insert is None:
+                # Queued for bulk_write - counted when the batch is flushed
+                pass
+            elif was_insert:
                 self.stats["inserted"] += 1
             else:
                 self.stats["updated"] += 1
@@ -133,12 +324,13 @@ class BaseIngester(ABC, Generic[T]):
             await self.connect()
             
             # Process each item from the data source
-            # IMPORTANT: Await each process_item to ensure completion
-            async for raw_item in self.fetch_data(**kwargs):
-                await self.process_item(raw_item)
+            # IMPORTANT: All workers finish before we flush and disconnect
+            await self._run_pipeline(**kwargs)
+            
+            # Write out any partially filled batches
+            await self.flush_writes()
             
             # Give a moment for any pending operations to complete
-            import asyncio
             await asyncio.sleep(0.1)
             
         except KeyboardInterrupt:
@@ -160,6 +352,7 @@ class BaseIngester(ABC, Generic[T]):
                 f"Processed: {self.stats['processed']}, "
                 f"Inserted: {self.stats['inserted']}, "
                 f"Updated: {self.stats['updated']}, "
+                f"Unchanged: {self.stats['unchanged']}, "
                 f"Errors: {self.stats['errors']}, "
                 f"Duration: {duration}"
             )
@@ -169,12 +362,50 @@ class BaseIngester(ABC, Generic[T]):
         
         return self.stats
     
+    async def _run_pipeline(self, **kwargs):
+        """
+        Feed fetch_data() items through a queue to pipeline_workers tasks.
+        
+        Fetching (network-bound) overlaps with transform/load, and the
+        bounded queue applies backpressure if processing falls behind.
+        
+        Args:
+            **kwargs: Passed to fetch_data()
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2 * self.batch_size)
+        done = object()
+        
+        async def worker():
+            while True:
+                raw_item = await queue.get()
+                if raw_item is done:
+                    return
+                try:
+                    await self.process_item(raw_item)
+                except Exception as e:
+                    # Keep the worker alive so the producer never blocks on a full queue
+                    self.stats["errors"] += 1
+                    self.logger.error(f"Error processing item: {e}", exc_info=True)
+        
+        workers = [asyncio.create_task(worker()) for _ in range(self.pipeline_workers)]
+        try:
+            async for raw_item in self.fetch_data(**kwargs):
+                await queue.put(raw_item)
+            for _ in workers:
+                await queue.put(done)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+    
     def reset_stats(self):
         """Reset statistics counters"""
         self.stats = {
             "processed": 0,
             "inserted": 0,
             "updated": 0,
+            "unchanged": 0,
             "errors": 0,
             "started_at": None,
             "completed_at": None
@@ -5,28 +5,90 @@ Handles fetching data from the Congress.gov API.
 API Docs: https://api.congress.gov/
 """
 
+import functools
+import json
 import httpx
 from datetime import date, datetime
+from pathlib import Path
 from typing import Optional
 
 from src.config import settings, CONGRESS_GOV_BASE_URL, CURRENT_CONGRESS
+from src.config.constants import HTTP_CACHE_DIR
+from src.ingestion.http_client import HTTP2_AVAILABLE, ResponseCache, parse_json
+from src.ingestion.rate_limit import CONGRESS_GOV_LIMITER
 from src.models import Vote, PoliticianVote, VotePosition
 
 
+# Congress.gov position strings (lowercased) -> our enum
+_POSITION_MAP = {
+    "yea": VotePosition.YEA,
+    "aye": VotePosition.YEA,
+    "yes": VotePosition.YEA,
+    "nay": VotePosition.NAY,
+    "no": VotePosition.NAY,
+    "not voting": VotePosition.NOT_VOTING,
+    "present": VotePosition.PRESENT,
+}
+
+# Chamber naming inconsistencies
+_SENATE_ALIASES = frozenset({"senate", "s"})
+_HOUSE_ALIASES = frozenset({"house", "house of representatives", "h"})
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_vote_date(date_str: str) -> date:
+    """
+    Parse a Congress.gov vote date ("2024-03-15" or "2024-03-15T14:02:00Z").
+    
+    Cached because every vote in a roll-call batch tends to share a date.
+    """
+    if "T" in date_str:
+        return datetime.fromisoformat(date_str[:-1] if date_str.endswith("Z") else date_str).date()
+    return date.fromisoformat(date_str[:10])
+
+
 class CongressGovClient:
     """
     Client for the Congress.gov API.
     
+    Responses are cached on disk and revalidated with ETag /
+    If-None-Match, so repeat lookups don't re-download unchanged data.
+    
+    Async, like the ingesters: one pooled httpx.AsyncClient is kept open
+    for the client's lifetime and requests share the Congress.gov rate
+    limiter. Call close() (or use it as an async context manager) when done.
+    
     Usage:
-        client = CongressGovClient()
-        votes = client.get_recent_votes(chamber="senate", limit=10)
+        async with CongressGovClient() as client:
+            votes = await client.get_member_votes("L000577", limit=10)
     """
     
-    def __init__(self):
+    def __init__(self, cache_ttl: Optional[float] = 3600):
+        """
+        Args:
+            cache_ttl: Seconds a cached response is reused without asking
+                       the server (None = always revalidate)
+        """
         self.base_url = CONGRESS_GOV_BASE_URL
         self.api_key = settings.CONGRESS_GOV_API_KEY
+        self.cache = ResponseCache(Path(HTTP_CACHE_DIR) / "congress_gov", ttl=cache_ttl)
+        self._client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            http2=HTTP2_AVAILABLE
+        )
+    
+    async def close(self):
+        """Close the pooled HTTP connection."""
+        await self._client.aclose()
+    
+    async def __aenter__(self):
+        return self
     
-    def _make_request(self, endpoint: str, params: dict = None) -> dict:
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def _make_request(self, endpoint: str, params: dict = None) -> dict:
         """
         Make a request to the Congress.gov API.
         
@@ -47,12 +109,27 @@ class CongressGovClient:
         if params:
             request_params.update(params)
         
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url, params=request_params)
-            response.raise_for_status()
-            return response.json()
+        cache_key = self.cache.key(url, request_params)
+        entry = self.cache.get(cache_key)
+        if entry and self.cache.is_fresh(entry):
+            return json.loads(entry["body"])
+        
+        async with CONGRESS_GOV_LIMITER:
+            response = await self._client.get(
+                url,
+                params=request_params,
+                headers=self.cache.conditional_headers(entry)
+            )
+        
+        if response.status_code == 304 and entry:
+            self.cache.touch(cache_key, entry)
+            return json.loads(entry["body"])
+        
+        response.raise_for_status()
+        self.cache.store(cache_key, response)
+        return parse_json(response)
     
-    def get_member(self, bioguide_id: str) -> dict:
+    async def get_member(self, bioguide_id: str) -> dict:
         """
         Get details about a specific member of Congress.
         
@@ -63,9 +140,9 @@ class CongressGovClient:
             Member data from Congress.gov
         """
         endpoint = f"/member/{bioguide_id}"
-        return self._make_request(endpoint)
+        return await self._make_request(endpoint)
     
-    def get_member_votes(
+    async def get_member_votes(
         self, 
         bioguide_id: str, 
         limit: int = 20,
@@ -85,10 +162,10 @@ class CongressGovClient:
         endpoint = f"/member/{bioguide_id}/votes"
         params = {"limit": limit, "offset": offset}
         
-        response = self._make_request(endpoint, params)
+        response = await self._make_request(endpoint, params)
         return response.get("votes", [])
     
-    def get_vote_details(
+    async def get_vote_details(
         self,
         congress: int,
         chamber: str,
@@ -108,7 +185,7 @@ class CongressGovClient:
             Vote details including how each member voted
         """
         endpoint = f"/vote/{congress}/{chamber}/{session}/{roll_call}"
-        return self._make_request(endpoint)
+        return await self._make_request(endpoint)
     
     def parse_vote_to_model(self, vote_data: dict, bioguide_id: str) -> tuple[Optional[Vote], Optional[PoliticianVote]]:
         """
@@ -127,9 +204,9 @@ class CongressGovClient:
             chamber = vote_data.get("chamber", "").lower()
             
             # Handle chamber naming inconsistencies
-            if chamber in ["senate", "s"]:
+            if chamber in _SENATE_ALIASES:
                 chamber = "senate"
-            elif chamber in ["house", "house of representatives", "h"]:
+            elif chamber in _HOUSE_ALIASES:
                 chamber = "house"
             
             roll_call = vote_data.get("rollCallNumber") or vote_data.get("rollNumber")
@@ -143,14 +220,7 @@ class CongressGovClient:
             
             # Parse date
             date_str = vote_data.get("date") or vote_data.get("voteDate")
-            if date_str:
-                # Handle different date formats
-                if "T" in date_str:
-                    vote_date = datetime.fromisoformat(date_str.replace("Z", "+00:00")).date()
-                else:
-                    vote_date = datetime.strptime(date_str[:10], "%Y-%m-%d").date()
-            else:
-                vote_date = date.today()
+            vote_date = _parse_vote_date(date_str) if date_str else date.today()
             
             # Create Vote model
             vote = Vote(
@@ -170,16 +240,7 @@ class CongressGovClient:
             position_str = vote_data.get("memberVotes", vote_data.get("position", "Not Voting"))
             
             # Map to our enum
-            position_map = {
-                "yea": VotePosition.YEA,
-                "aye": VotePosition.YEA,
-                "yes": VotePosition.YEA,
-                "nay": VotePosition.NAY,
-                "no": VotePosition.NAY,
-                "not voting": VotePosition.NOT_VOTING,
-                "present": VotePosition.PRESENT,
-            }
-            position = position_map.get(position_str.lower(), VotePosition.NOT_VOTING)
+            position = _POSITION_MAP.get(position_str.lower(), VotePosition.NOT_VOTING)
             
             # Create PoliticianVote model
             politician_vote = PoliticianVote(
@@ -7,30 +7,73 @@ Handles transitions like retirements, special elections, and new terms.
 ENHANCED: Now supports native filtering by state and chamber to minimize API calls.
 """
 import asyncio
+import json
 import httpx
+from pymongo import UpdateMany
 from typing import AsyncGenerator, Optional
-from datetime import date, datetime
+from pathlib import Path
 import logging
 
 from src.ingestion.base import BaseIngester
 from src.models.politician import Politician, Chamber, Party
 from src.config.settings import settings
-from src.config.constants import CONGRESS_GOV_BASE_URL, US_STATES
-from src.database.normalization import normalize_politician
+from src.config.constants import CONGRESS_GOV_BASE_URL, HTTP_CACHE_DIR
+from src.database.indexes import create_politicians_indexes
+from src.database.normalization import normalize_politician, normalize_state
+from src.ingestion.http_client import ResponseCache, close_http_client, get_http_client, parse_json
+from src.ingestion.rate_limit import CONGRESS_GOV_LIMITER
 
 logger = logging.getLogger(__name__)
 
+# Congress.gov partyName -> Party; other names go through _party_from_name()
+_PARTY_MAP = {
+    "Republican": Party.REPUBLICAN,
+    "Democratic": Party.DEMOCRAT,
+    "Democrat": Party.DEMOCRAT,
+    "Independent": Party.INDEPENDENT,
+    "Independent Democrat": Party.DEMOCRAT,
+    "Independent Republican": Party.REPUBLICAN,
+}
+
+
+def _party_from_name(party_name: str) -> Party:
+    """Map a partyName to a Party; names mentioning no major party are OTHER."""
+    party = _PARTY_MAP.get(party_name)
+    if party is not None:
+        return party
+    if "Republican" in party_name:
+        return Party.REPUBLICAN
+    if "Democrat" in party_name:
+        return Party.DEMOCRAT
+    if "Independent" in party_name:
+        return Party.INDEPENDENT
+    return Party.OTHER
+
+# Lowercased term chamber -> (Chamber, title); anything else is House
+_CHAMBER_MAP = {
+    "senate": (Chamber.SENATE, "Senator"),
+    "house of representatives": (Chamber.HOUSE, "Representative"),
+}
+_DEFAULT_CHAMBER = (Chamber.HOUSE, "Representative")
+
 
 class CongressMembersIngester(BaseIngester[Politician]):
     """
     Ingest current members of Congress from Congress.gov API.
     
-    Uses the /member/congress/{congress}/{state} endpoint with 
+    Uses the /member/congress/{congress} endpoint (or
+    /member/congress/{congress}/{state} with a state filter) with
     currentMember=true to get only active legislators.
     
     Supports filtering by state and chamber to minimize API calls.
     """
     
+    # Congress.gov requests (member lists and details) in flight at once
+    request_concurrency: int = 10
+    
+    # Unique bioguide_id index for the content-guarded upserts
+    required_indexes = (create_politicians_indexes,)
+    
     def __init__(
         self,
         congress: int = 118,
@@ -57,6 +100,26 @@ class CongressMembersIngester(BaseIngester[Politician]):
         self.fetch_details = fetch_details
         self.api_key = settings.CONGRESS_GOV_API_KEY
         self.base_url = CONGRESS_GOV_BASE_URL
+        
+        # Request params are the same for every page / member
+        self._list_params = {
+            "currentMember": "true",  # Only active members
+            "api_key": self.api_key,
+            "format": "json",
+            "limit": 250
+        }
+        self._detail_params = {
+            "api_key": self.api_key,
+            "format": "json"
+        }
+        
+        # Member details rarely change, so revalidate them with ETags
+        # instead of re-downloading every sync
+        self.details_cache = ResponseCache(Path(HTTP_CACHE_DIR) / "congress_members")
+        
+        # (state, district) -> bioguide_id of the in-office House member,
+        # loaded from MongoDB on the first House member of a run
+        self._house_seats: Optional[dict[tuple, str]] = None
 
         # Log filter configuration
         if self.state_filter:
@@ -71,90 +134,123 @@ class CongressMembersIngester(BaseIngester[Politician]):
         Fetch current members, optionally filtered by state.
         
         If state_filter is set, only fetches that state.
-        Otherwise, fetches all states.
+        Otherwise, pages through the whole Congress roster
+        (a few requests instead of one per state).
         
         Chamber filtering is applied during iteration to skip unwanted members.
         
         Yields:
             Raw member data from Congress.gov API
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Determine which states to fetch
+        client = get_http_client()
+        semaphore = asyncio.Semaphore(self.request_concurrency)
+        page_size = self._list_params["limit"]
+        
+        async def fetch_page(url: str, offset: int = 0) -> Optional[list[dict]]:
+            """Fetch one page of a member list ([] if no data, None on error)."""
+            try:
+                params = {**self._list_params, "offset": offset}
+                async with semaphore, CONGRESS_GOV_LIMITER:
+                    # Streamed so error responses are dropped unread
+                    async with client.stream("GET", url, params=params) as response:
+                        if response.status_code == 404:
+                            # Some territories might not have data
+                            self.logger.debug(f"No data for {url}")
+                            return []
+                            
+                        response.raise_for_status()
+                        await response.aread()
+                
+                return parse_json(response).get("members", [])
+                
+            except httpx.HTTPError as e:
+                self.logger.error(f"HTTP error fetching {url}: {e}")
+                self.stats["errors"] += 1
+            except Exception as e:
+                self.logger.error(f"Error fetching {url}: {e}")
+                self.stats["errors"] += 1
+            return None
+        
+        async def member_batches() -> AsyncGenerator[list[dict], None]:
+            """Yield member lists (with state_code set) as they arrive."""
             if self.state_filter:
                 # Only fetch the specified state
-                states_to_fetch = [self.state_filter]
                 self.logger.info(f"Fetching only {self.state_filter} (state filter active)")
-            else:
-                # Fetch all states
-                states_to_fetch = US_STATES
-                self.logger.info(f"Fetching all {len(US_STATES)} states")
+                url = f"{self.base_url}/member/congress/{self.congress}/{self.state_filter}"
+                members = await fetch_page(url) or []
+                self.logger.info(f"Found {len(members)} members for {self.state_filter}")
+                for member in members:
+                    member["state_code"] = self.state_filter
+                yield members
+                return
             
-            # Fetch for each state
-            for state_code in states_to_fetch:
-                try:
-                    url = f"{self.base_url}/member/congress/{self.congress}/{state_code}"
-                    params = {
-                        "currentMember": "true",  # Only active members
-                        "api_key": self.api_key,
-                        "format": "json",
-                        "limit": 250
-                    }
-                    
-                    self.logger.info(f"Fetching members for {state_code}...")
-                    response = await client.get(url, params=params)
-                    
-                    if response.status_code == 404:
-                        # Some territories might not have data
-                        self.logger.debug(f"No data for {state_code}")
-                        continue
-                        
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    members = data.get("members", [])
-                    self.logger.info(f"Found {len(members)} members for {state_code}")
-                    
-                    # Apply chamber filter if set
-                    filtered_count = 0
-                    for member in members:
-                        # Add state code to the member data
-                        member["state_code"] = state_code
-
-                        # Apply chamber filter if specified
-                        if self.chamber_filter:
-                            member_chamber = self._extract_chamber(member)
-                            if member_chamber != self.chamber_filter:
-                                continue  # Skip this member
-
-                        # Fetch detailed data if requested
-                        if self.fetch_details:
-                            bioguide_id = member.get("bioguideId")
-                            if bioguide_id:
-                                details = await self.fetch_member_details(bioguide_id, client)
-                                if details:
-                                    # Merge details into member data
-                                    member["_details"] = details
-                                # Small delay to respect rate limits
-                                await asyncio.sleep(0.2)
-
-                        filtered_count += 1
-                        yield member
-                    
-                    if self.chamber_filter:
-                        self.logger.info(
-                            f"After chamber filter: {filtered_count}/{len(members)} members"
+            # Fetch the whole roster, page by page
+            self.logger.info(f"Fetching all current members of Congress {self.congress}")
+            url = f"{self.base_url}/member/congress/{self.congress}"
+            offset = 0
+            while True:
+                members = await fetch_page(url, offset)
+                if not members:
+                    break
+                
+                self.logger.info(f"Found {len(members)} members at offset {offset}")
+                resolved = []
+                for member in members:
+                    # Roster entries carry the full state name ("Utah");
+                    # fall back to the latest term's stateCode
+                    state_code = normalize_state(member.get("state"))
+                    if state_code is None:
+                        terms = member.get("terms", {}).get("item", [])
+                        state_code = normalize_state(terms[-1].get("stateCode")) if terms else None
+                    if state_code is None:
+                        self.logger.warning(
+                            f"Skipping {member.get('bioguideId')}: "
+                            f"unknown state {member.get('state')!r}"
                         )
-                    
-                    # Respect rate limits (5000/hour = ~1.4/second)
-                    await asyncio.sleep(0.2)
-                    
-                except httpx.HTTPError as e:
-                    self.logger.error(f"HTTP error fetching {state_code}: {e}")
-                    self.stats["errors"] += 1
-                except Exception as e:
-                    self.logger.error(f"Error fetching {state_code}: {e}")
-                    self.stats["errors"] += 1
-    
+                        continue
+                    member["state_code"] = state_code
+                    resolved.append(member)
+                yield resolved
+                
+                if len(members) < page_size:
+                    break
+                offset += page_size
+        
+        async def fetch_details(bioguide_id: str) -> Optional[dict]:
+            async with semaphore:
+                return await self.fetch_member_details(bioguide_id, client)
+        
+        async for members in member_batches():
+            # Apply chamber filter if set
+            selected = []
+            for member in members:
+                # Apply chamber filter if specified
+                if self.chamber_filter:
+                    member_chamber = self._extract_chamber(member)
+                    if member_chamber != self.chamber_filter:
+                        continue  # Skip this member
+                
+                selected.append(member)
+            
+            if self.chamber_filter and members:
+                self.logger.info(
+                    f"After chamber filter: {len(selected)}/{len(members)} members"
+                )
+            
+            # Fetch detailed data for the whole batch concurrently
+            if self.fetch_details:
+                pending = [m for m in selected if m.get("bioguideId")]
+                details_list = await asyncio.gather(
+                    *(fetch_details(m["bioguideId"]) for m in pending)
+                )
+                for member, details in zip(pending, details_list):
+                    if details:
+                        # Merge details into member data
+                        member["_details"] = details
+            
+            for member in selected:
+                yield member
+
     def _extract_chamber(self, member: dict) -> Optional[str]:
         """
         Extract chamber from member data.
@@ -178,6 +274,9 @@ class CongressMembersIngester(BaseIngester[Politician]):
     async def fetch_member_details(self, bioguide_id: str, client: httpx.AsyncClient) -> Optional[dict]:
         """
         Fetch detailed member information including contact info.
+        
+        The request is conditional on the cached copy (If-None-Match /
+        If-Modified-Since); a 304 reuses the cached body.
 
         Args:
             bioguide_id: The member's bioguide ID
@@ -188,15 +287,28 @@ class CongressMembersIngester(BaseIngester[Politician]):
         """
         try:
             url = f"{self.base_url}/member/{bioguide_id}"
-            params = {
-                "api_key": self.api_key,
-                "format": "json"
-            }
+            params = self._detail_params
+            cache_key = self.details_cache.key(url, params)
+            entry = self.details_cache.get(cache_key)
 
             self.logger.debug(f"Fetching details for {bioguide_id}...")
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            async with CONGRESS_GOV_LIMITER:
+                # Streamed so the body is only read for a 200
+                async with client.stream(
+                    "GET",
+                    url,
+                    params=params,
+                    headers=self.details_cache.conditional_headers(entry)
+                ) as response:
+                    if response.status_code == 304 and entry:
+                        self.details_cache.touch(cache_key, entry)
+                        return json.loads(entry["body"]).get("member", {})
+                    
+                    response.raise_for_status()
+                    await response.aread()
+            
+            self.details_cache.store(cache_key, response)
+            data = parse_json(response)
 
             return data.get("member", {})
 
@@ -222,32 +334,25 @@ class CongressMembersIngester(BaseIngester[Politician]):
         terms = raw.get("terms", {}).get("item", [])
         current_term = terms[-1] if terms else {}  # -1 gets last/most recent term
 
-        chamber_str = current_term.get("chamber", "").lower()
-        if chamber_str == "senate":
-            chamber = Chamber.SENATE
+        chamber, title = _CHAMBER_MAP.get(
+            current_term.get("chamber", "").lower(), _DEFAULT_CHAMBER
+        )
+        if chamber == Chamber.SENATE:
             district = None
         else:  # House
-            chamber = Chamber.HOUSE
             district_num = raw.get("district")
             district = int(district_num) if district_num else None
 
         # Map party
         party_name = raw.get("partyName", "")
-        if "Republican" in party_name:
-            party = Party.REPUBLICAN
-        elif "Democrat" in party_name:
-            party = Party.DEMOCRAT
-        elif "Independent" in party_name:
-            party = Party.INDEPENDENT
-        else:
-            party = Party.OTHER
+        party = _party_from_name(party_name)
 
         # Parse name - API returns "Last, First" or "Last, First Middle"
         full_name_raw = raw.get("name", "")
-        if ", " in full_name_raw:
-            parts = full_name_raw.split(", ", 1)
-            last_name = parts[0].strip()
-            first_name = parts[1].strip()
+        last, sep, first = full_name_raw.partition(", ")
+        if sep:
+            last_name = last.strip()
+            first_name = first.strip()
             full_name = f"{first_name} {last_name}"
         else:
             # Fallback if format is different
@@ -261,12 +366,6 @@ class CongressMembersIngester(BaseIngester[Politician]):
         if not bioguide_id:
             raise ValueError(f"Missing bioguideId for {full_name}")
 
-        # Title
-        if chamber == Chamber.SENATE:
-            title = "Senator"
-        else:
-            title = "Representative"
-
         # Extract contact information from detailed data if available
         office = None
         phone = None
@@ -320,46 +419,49 @@ class CongressMembersIngester(BaseIngester[Politician]):
             website=raw.get("officialWebsiteUrl"),
             office=office,
             phone=phone,
-            last_updated=datetime.utcnow()
+            last_updated=self.batch_timestamp()
         )
         
-    async def load(self, politician: Politician) -> bool:
+    async def load(self, politician: Politician) -> None:
         """
-        Upsert politician into MongoDB.
+        Queue the politician upsert for the next bulk_write batch.
         
-        Also handles marking old records as out of office when members change.
+        Also queues marking old records as out of office when members change.
         
         Args:
             politician: Politician model to save
-            
-        Returns:
-            True if this was a new insert, False if update
         """
-        collection = self.db.politicians
-        
         # Mark old occupant as out of office (House only)
         # Note: We only do this for House because each district has exactly 1 rep.
         # For Senate, states have 2 senators (different classes), so we can't
         # automatically determine which seat without Senate class info.
+        # Only the seats whose occupant changed need a write.
         if politician.chamber == Chamber.HOUSE:
-            query = {
-                "state": politician.state,
-                "district": politician.district,
-                "chamber": "house",
-                "in_office": True,
-                "bioguide_id": {"$ne": politician.bioguide_id}
-            }
-
-            update_result = await collection.update_many(
-                query,
-                {"$set": {"in_office": False, "last_updated": datetime.utcnow()}}
-            )
-
-            if update_result.modified_count > 0:
-                self.logger.info(
-                    f"Marked {update_result.modified_count} old record(s) as out of office "
-                    f"for {politician.full_name}'s seat"
+            if self._house_seats is None:
+                await self._load_house_seats()
+            
+            seat = (politician.state, politician.district)
+            previous = self._house_seats.get(seat)
+            if previous and previous != politician.bioguide_id:
+                query = {
+                    "state": politician.state,
+                    "district": politician.district,
+                    "chamber": "house",
+                    "in_office": True,
+                    "bioguide_id": {"$ne": politician.bioguide_id}
+                }
+
+                await self.queue_write(
+                    "politicians",
+                    # Drop the content hash so the member is rewritten in full
+                    # (back in office) if they are synced again later
+                    UpdateMany(query, {
+                        "$set": {"in_office": False, "last_updated": self.batch_timestamp()},
+                        "$unset": {"_doc_hash": ""}
+                    }),
+                    is_item=False
                 )
+            self._house_seats[seat] = politician.bioguide_id
         
         # Convert Pydantic model to dict
         politician_data = politician.model_dump()
@@ -369,13 +471,32 @@ class CongressMembersIngester(BaseIngester[Politician]):
         normalized_data = normalize_politician(politician_data)
         
         # Now upsert the current member with normalized data
-        result = await collection.update_one(
+        # (skipped by MongoDB if nothing changed since the last sync)
+        await self.queue_upsert_if_changed(
+            "politicians",
             {"bioguide_id": politician.bioguide_id},
-            {"$set": normalized_data},
-            upsert=True
+            normalized_data
         )
+    
+    async def _load_house_seats(self):
+        """
+        Load the current in-office House roster into self._house_seats.
+        
+        Lets load() skip the retire-previous-occupant update for every
+        seat whose occupant hasn't changed.
+        """
+        query = {"chamber": "house", "in_office": True}
+        if self.state_filter:
+            query["state"] = self.state_filter
         
-        return result.upserted_id is not None
+        # Covered by idx_house_seats, so only index entries are read
+        projection = {"state": 1, "district": 1, "bioguide_id": 1, "_id": 0}
+        cursor = self.db.politicians.find(query, projection)
+        self._house_seats = {
+            (doc.get("state"), doc.get("district")): doc["bioguide_id"]
+            async for doc in cursor
+        }
+        self.logger.debug(f"Loaded {len(self._house_seats)} in-office House seats")
     
     async def run_full_sync(self) -> dict:
         """
@@ -401,6 +522,7 @@ class CongressMembersIngester(BaseIngester[Politician]):
                 f"Starting full sync of Congress {self.congress} members..."
             )
         
+        self._house_seats = None  # Reload the roster for this run
         stats = await self.run()
         
         self.logger.info("Sync complete!")
@@ -418,6 +540,7 @@ async def main():
         chamber_filter="senate"
     )
     stats = await ingester.run_full_sync()
+    await close_http_client()
     
     print("\n=== Sync Complete ===")
     print(f"Processed: {stats['processed']}")
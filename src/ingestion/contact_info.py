@@ -7,13 +7,24 @@ a community-maintained dataset of legislator contact information.
 Source: https://github.com/unitedstates/congress-legislators
 """
 import asyncio
+import json
+import pickle
 import httpx
 import yaml
-from typing import AsyncGenerator
-from datetime import datetime
+from pymongo import UpdateOne
+from typing import Any, AsyncGenerator, Optional
+from pathlib import Path
 import logging
 
+from src.config.constants import HTTP_CACHE_DIR
 from src.ingestion.base import BaseIngester
+from src.ingestion.http_client import close_http_client, get_http_client
+
+# libyaml-backed loader is much faster; PyYAML may be built without it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 
 class ContactInfoIngester(BaseIngester[dict]):
@@ -29,33 +40,78 @@ class ContactInfoIngester(BaseIngester[dict]):
     # GitHub raw content URLs for legislator data
     #LEGISLATORS_CURRENT_URL = "https://theunitedstates.io/congress-legislators/legislators-current.yaml"
     LEGISLATORS_CURRENT_URL = "https://raw.githubusercontent.com/unitedstates/congress-legislators/main/legislators-current.yaml"
+    
+    # Legislators are independent; keep transforming while a batch is written
+    pipeline_workers: int = 4
+    
+    # Parsed legislators from the last download, plus its ETag / Last-Modified
+    CACHE_DIR = Path(HTTP_CACHE_DIR) / "legislators"
+    
     def __init__(self):
         super().__init__()
         self.legislators_data = None
+        self._cache_data = self.CACHE_DIR / "legislators-current.pkl"
+        self._cache_meta = self.CACHE_DIR / "legislators-current.json"
+        
+        # bioguide_ids of politicians in the database, loaded per run;
+        # legislators not in it are skipped without a write
+        self._known_ids: Optional[set[str]] = None
         
     async def fetch_data(self, **kwargs) -> AsyncGenerator[dict, None]:
         """
         Fetch current legislators from GitHub repository.
         
+        The download is conditional on the cached copy; if GitHub answers
+        304 Not Modified the previously parsed legislators are replayed
+        from disk without downloading or parsing any YAML.
+        
         Yields:
             Legislator records with contact information
         """
+        # One query up front instead of a no-op update per unknown legislator
+        self._known_ids = set(await self.db.politicians.distinct("bioguide_id"))
+        self.logger.info(f"{len(self._known_ids)} politicians in database to enrich")
+        
         self.logger.info("Fetching legislator data from unitedstates/congress-legislators...")
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(self.LEGISLATORS_CURRENT_URL)
-                response.raise_for_status()
-                
-                # Parse YAML
-                data = yaml.safe_load(response.text)
-                
-                self.logger.info(f"Loaded {len(data)} legislators from GitHub")
-                
-                # Yield each legislator
-                for legislator in data:
-                    yield legislator
+            meta = self._read_cache_meta()
+            headers = {}
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+            
+            count = 0
+            client = get_http_client()
+            async with client.stream("GET", self.LEGISLATORS_CURRENT_URL, headers=headers) as response:
+                if response.status_code == 304 and meta:
+                    self.logger.info("Legislator data unchanged, using local cache")
+                    for legislator in self._read_cached_legislators():
+                        count += 1
+                        yield legislator
+                else:
+                    response.raise_for_status()
+                    
+                    # Parse and yield legislators as the YAML downloads,
+                    # pickling each one for the next run
+                    self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    tmp_path = self._cache_data.with_suffix(".tmp")
+                    with open(tmp_path, "wb") as cache_file:
+                        async for legislator in self._parse_legislators(response):
+                            pickle.dump(legislator, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+                            count += 1
+                            yield legislator
                     
+                    # Only a complete download replaces the cache
+                    tmp_path.replace(self._cache_data)
+                    self._cache_meta.write_text(json.dumps({
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                    }), encoding="utf-8")
+            
+            self.logger.info(f"Loaded {count} legislators from GitHub")
+                
         except httpx.HTTPError as e:
             self.logger.error(f"HTTP error fetching legislator data: {e}")
             raise
@@ -66,7 +122,55 @@ class ContactInfoIngester(BaseIngester[dict]):
             self.logger.error(f"Unexpected error: {e}")
             raise
     
-    async def transform(self, raw: dict) -> dict:
+    def _read_cache_meta(self) -> dict:
+        """Validators of the cached download ({} if there is no usable cache)."""
+        if not self._cache_data.exists():
+            return {}
+        try:
+            return json.loads(self._cache_meta.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+    
+    def _read_cached_legislators(self):
+        """Yield the legislators pickled by the last full download."""
+        with open(self._cache_data, "rb") as cache_file:
+            while True:
+                try:
+                    yield pickle.load(cache_file)
+                except EOFError:
+                    return
+    
+    async def _parse_legislators(self, response: httpx.Response) -> AsyncGenerator[dict, None]:
+        """
+        Incrementally parse the legislators YAML from a streamed response.
+        
+        The file is one top-level sequence, so every line starting with
+        "- " begins a new legislator. Complete items are parsed as soon
+        as they have arrived, so neither the whole document nor the whole
+        list of legislators is ever held in memory.
+        
+        Args:
+            response: Streamed response for legislators-current.yaml
+            
+        Yields:
+            One legislator record at a time
+        """
+        buffer = b""
+        async for chunk in response.aiter_bytes():
+            buffer += chunk
+            cut = buffer.rfind(b"\n- ")
+            if cut < 0:
+                continue
+            
+            # Everything before the last item start is complete
+            complete, buffer = buffer[:cut + 1], buffer[cut + 1:]
+            for legislator in yaml.load(complete, Loader=YamlLoader) or []:
+                yield legislator
+        
+        for legislator in yaml.load(buffer, Loader=YamlLoader) or []:
+            yield legislator
+    
+    async def transform(self, raw: dict[str, Any]) -> dict[str, Any]:
         """
         Extract contact information from legislator record.
         
@@ -106,15 +210,15 @@ class ContactInfoIngester(BaseIngester[dict]):
         
         return contact_info
     
-    async def load(self, contact_info: dict) -> bool:
+    async def load(self, contact_info: dict[str, Any]) -> None:
         """
-        Update existing politician record with contact information.
+        Queue an update of an existing politician's contact information.
+        
+        The update is sent with the next bulk_write batch; politicians
+        that don't exist are not created.
         
         Args:
             contact_info: Dict with bioguide_id and contact fields
-            
-        Returns:
-            True if record was updated, False if not found
         """
         bioguide_id = contact_info.get("bioguide_id")
         if not bioguide_id:
@@ -128,42 +232,36 @@ class ContactInfoIngester(BaseIngester[dict]):
         
         if not update_fields:
             self.logger.debug(f"No contact info to update for {bioguide_id}")
-            return False
+            return
         
-        # Add last_updated timestamp
-        update_fields["last_updated"] = datetime.utcnow()
+        # Only match when some contact field actually differs, so
+        # unchanged records cost no write
+        changed = [{k: {"$ne": v}} for k, v in update_fields.items()]
         
-        collection = self.db.politicians
+        # Add last_updated timestamp
+        update_fields["last_updated"] = self.batch_timestamp()
         
-        # Update only if politician exists
-        result = await collection.update_one(
-            {"bioguide_id": bioguide_id},
-            {"$set": update_fields}
+        # Update only if politician exists (no upsert); updated/unchanged
+        # are counted from the bulk_write result
+        await self.queue_write(
+            "politicians",
+            UpdateOne({"bioguide_id": bioguide_id, "$or": changed}, {"$set": update_fields})
         )
-        
-        if result.matched_count == 0:
-            self.logger.debug(f"Politician not found in DB: {bioguide_id}")
-            return False
-        
-        if result.modified_count > 0:
-            self.logger.debug(f"Updated contact info for {bioguide_id}")
-            return True
-        
-        self.logger.debug(f"No contact changes for {bioguide_id}")
-        return False
     
-    async def process_item(self, raw_data: dict) -> bool:
+    async def process_item(self, raw_data: dict[str, Any]) -> bool:
         """
-        Process a single legislator, tracking only updates for stats.
+        Process a single legislator, logging progress every 50.
         """
         try:
             self.stats["processed"] += 1
             
-            item = await self.transform(raw_data)
-            was_updated = await self.load(item)
+            bioguide_id = raw_data.get("id", {}).get("bioguide")
+            if self._known_ids is not None and bioguide_id not in self._known_ids:
+                self.logger.debug(f"Politician not found in DB: {bioguide_id}")
+                return True
             
-            if was_updated:
-                self.stats["updated"] += 1
+            item = await self.transform(raw_data)
+            await self.load(item)
             
             if self.stats["processed"] % 50 == 0:
                 self.logger.info(
@@ -198,6 +296,7 @@ async def main():
     
     ingester = ContactInfoIngester()
     stats = await ingester.run_enrichment()
+    await close_http_client()
     
     print("\n=== Enrichment Complete ===")
     print(f"Processed: {stats['processed']}")
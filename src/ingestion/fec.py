@@ -8,19 +8,62 @@ Usage:
     ingester = FECIngester()
     await ingester.run(candidate_id="S2UT00106")  # Mike Lee
 """
+import asyncio
+import functools
+import json
 import httpx
-from typing import AsyncGenerator, Optional
+from operator import itemgetter
+from pymongo.errors import BulkWriteError
+from typing import Any, AsyncGenerator, Awaitable, Callable, ClassVar, Optional
 from datetime import date, datetime
 from decimal import Decimal
+from pathlib import Path
 import logging
 
-from src.ingestion.base import BaseIngester
+from src.config.constants import HTTP_CACHE_DIR
+
+from src.ingestion.base import DUPLICATE_KEY_ERROR, BaseIngester, content_hash
+from src.ingestion.http_client import get_http_client, iter_json_items, parse_json, with_retries
+from src.ingestion.rate_limit import FEC_LIMITER
 from src.models.finance import Contribution, ContributionType
 from src.config.settings import settings
+from src.database.indexes import create_contributions_indexes
 from src.database.normalization import normalize_contribution
 
 logger = logging.getLogger(__name__)
 
+# Schedule A fields copied as-is into Contribution
+_FEC_FIELDS = (
+    "committee_id",
+    "contributor_employer",
+    "contributor_occupation",
+    "contributor_city",
+    "contributor_state",
+    "contributor_zip",
+)
+
+# Fetches all of _FEC_FIELDS in one C-level call
+_FEC_GETTER = itemgetter(*_FEC_FIELDS)
+
+# FEC entity_type -> ContributionType (anything else is OTHER)
+_ENTITY_MAP = {
+    "IND": ContributionType.INDIVIDUAL,
+    "PAC": ContributionType.PAC,
+    "COM": ContributionType.PAC,
+    "PTY": ContributionType.PARTY,
+    "CAN": ContributionType.CANDIDATE,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_fec_date(date_str: str) -> date:
+    """
+    Parse an FEC receipt date ("2024-03-15T00:00:00").
+    
+    Cached because a page of contributions shares only a handful of dates.
+    """
+    return date.fromisoformat(date_str[:10])
+
 
 class FECIngester(BaseIngester[Contribution]):
     """
@@ -32,6 +75,22 @@ class FECIngester(BaseIngester[Contribution]):
     
     BASE_URL = "https://api.open.fec.gov/v1"
     
+    # Contributions are independent; keep transforming while a batch is written
+    pipeline_workers: int = 4
+    
+    # Result pages requested at once after the first page
+    page_concurrency: int = 8
+    
+    # Unique id index for insert_many duplicate detection and the
+    # content-guarded upserts
+    required_indexes = (create_contributions_indexes,)
+    
+    # FEC metadata (candidate names, ...) shared by all instances and
+    # persisted across runs; lookups in flight are shared too
+    META_CACHE_PATH = Path(HTTP_CACHE_DIR) / "fec" / "fec_meta.json"
+    _meta_cache: ClassVar[Optional[dict[str, str]]] = None
+    _meta_requests: ClassVar[dict[str, asyncio.Task]] = {}
+    
     def __init__(self, candidate_name: Optional[str] = None, bioguide_id: Optional[str] = None):
         super().__init__()
         self.api_key = settings.FEC_API_KEY
@@ -39,6 +98,7 @@ class FECIngester(BaseIngester[Contribution]):
             raise ValueError("FEC_API_KEY not found in settings")
         self.candidate_name = candidate_name  # Cache candidate name
         self.bioguide_id = bioguide_id  # Store bioguide_id for linking
+        self._pending_docs: list[dict[str, Any]] = []
     
     async def fetch_candidate_name(self, candidate_id: str) -> str:
         """
@@ -53,27 +113,96 @@ class FECIngester(BaseIngester[Contribution]):
         if self.candidate_name:
             return self.candidate_name
         
+        name = await self._cached(
+            f"candidate:{candidate_id}",
+            lambda: self._lookup_candidate_name(candidate_id)
+        )
+        if name is None:
+            return "Unknown Candidate"
+        
+        self.candidate_name = name
+        return name
+    
+    async def _lookup_candidate_name(self, candidate_id: str) -> Optional[str]:
+        """Request a candidate's name from the FEC API (None if unavailable)."""
         endpoint = f"{self.BASE_URL}/candidate/{candidate_id}/"
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
+        client = get_http_client()
+        
+        async def request() -> dict:
+            async with FEC_LIMITER:
                 response = await client.get(
                     endpoint,
                     params={"api_key": self.api_key}
                 )
-                response.raise_for_status()
-                data = response.json()
+            response.raise_for_status()
+            return parse_json(response)
+        
+        try:
+            data = await with_retries(request)
+            
+            results = data.get("results", [])
+            if results:
+                return results[0].get("name", "Unknown Candidate")
                 
-                results = data.get("results", [])
-                if results:
-                    name = results[0].get("name", "Unknown Candidate")
-                    self.candidate_name = name
-                    return name
-                    
-            except Exception as e:
-                self.logger.error(f"Error fetching candidate name: {e}")
+        except Exception as e:
+            self.logger.error(f"Error fetching candidate name: {e}")
+        
+        return None
+    
+    @classmethod
+    async def _cached(
+        cls,
+        key: str,
+        lookup: Callable[[], Awaitable[Optional[str]]]
+    ) -> Optional[str]:
+        """
+        Resolve an FEC metadata value through the shared cache.
+        
+        Concurrent callers asking for the same key wait on one lookup.
+        Only successful lookups (not None) are cached and saved to disk.
+        
+        Args:
+            key: Cache key, e.g. "candidate:S2UT00106"
+            lookup: Coroutine factory that fetches the value
+            
+        Returns:
+            Cached or freshly fetched value
+        """
+        if cls._meta_cache is None:
+            cls._meta_cache = cls._read_meta_cache()
+        if key in cls._meta_cache:
+            return cls._meta_cache[key]
         
-        return "Unknown Candidate"
+        task = cls._meta_requests.get(key)
+        if task is None:
+            task = asyncio.ensure_future(lookup())
+            cls._meta_requests[key] = task
+            try:
+                value = await task
+            finally:
+                del cls._meta_requests[key]
+            if value is not None:
+                cls._meta_cache[key] = value
+                cls._write_meta_cache()
+            return value
+        
+        return await asyncio.shield(task)
+    
+    @classmethod
+    def _read_meta_cache(cls) -> dict[str, str]:
+        try:
+            return json.loads(cls.META_CACHE_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+    
+    @classmethod
+    def _write_meta_cache(cls):
+        try:
+            cls.META_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            cls.META_CACHE_PATH.write_text(json.dumps(cls._meta_cache), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Could not save FEC metadata cache: {e}")
     
     async def fetch_data(
         self,
@@ -106,64 +235,158 @@ class FECIngester(BaseIngester[Contribution]):
         
         endpoint = f"{self.BASE_URL}/schedules/schedule_a/"
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            page = 1
+        client = get_http_client()
+        semaphore = asyncio.Semaphore(self.page_concurrency)
+        
+        params = {
+            "api_key": self.api_key,
+            "two_year_transaction_period": cycle,
+            "per_page": per_page,
+            "sort": "-contribution_receipt_date"
+        }
+        
+        # Filter by candidate or committee
+        if candidate_id:
+            params["candidate_id"] = candidate_id
+        elif committee_id:
+            params["committee_id"] = committee_id
+        
+        async def fetch_page(page: int) -> Optional[dict]:
+            """Fetch one page of contributions (None on HTTP error)."""
+            self.logger.info(
+                f"Fetching FEC contributions: "
+                f"candidate={candidate_id}, cycle={cycle}, page={page}"
+            )
             
-            while True:  # Changed from while page <= max_pages
-                # Check max_pages limit
-                if max_pages is not None and page > max_pages:
-                    self.logger.info(f"Reached max_pages limit ({max_pages})")
-                    break
-                params = {
-                    "api_key": self.api_key,
-                    "two_year_transaction_period": cycle,
-                    "per_page": per_page,
-                    "page": page,
-                    "sort": "-contribution_receipt_date"
-                }
-                
-                # Filter by candidate or committee
-                if candidate_id:
-                    params["candidate_id"] = candidate_id
-                elif committee_id:
-                    params["committee_id"] = committee_id
-                
-                self.logger.info(
-                    f"Fetching FEC contributions: "
-                    f"candidate={candidate_id}, cycle={cycle}, page={page}"
-                )
-                
-                try:
-                    response = await client.get(endpoint, params=params)
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    results = data.get("results", [])
-                    if not results:
-                        self.logger.info("No more results")
-                        break
-                    
-                    for item in results:
-                        yield item
-                    
-                    # Check if there are more pages
-                    pagination = data.get("pagination", {})
-                    total_pages = pagination.get("pages", 0)
-                    
-                    if page >= total_pages:
-                        self.logger.info(f"Reached last page ({total_pages})")
-                        break
-                    
-                    page += 1
-                    
-                except httpx.HTTPError as e:
-                    self.logger.error(f"HTTP error fetching FEC data: {e}")
-                    break
+            async def request() -> dict:
+                async with FEC_LIMITER:
+                    response = await client.get(endpoint, params={**params, "page": page})
+                response.raise_for_status()
+                return parse_json(response)
+            
+            try:
+                async with semaphore:
+                    return await with_retries(request)
+            except httpx.HTTPError as e:
+                self.logger.error(f"HTTP error fetching FEC data (page {page}): {e}")
+                return None
+        
+        # Contributions from the concurrent pages; None marks a finished page
+        items: asyncio.Queue = asyncio.Queue(maxsize=per_page)
+        
+        async def stream_page(page: int):
+            """Stream one page's contributions into the items queue."""
+            self.logger.info(
+                f"Fetching FEC contributions: "
+                f"candidate={candidate_id}, cycle={cycle}, page={page}"
+            )
+            queued = 0
+            
+            async def request():
+                nonlocal queued
+                async with FEC_LIMITER:
+                    async with client.stream("GET", endpoint, params={**params, "page": page}) as response:
+                        response.raise_for_status()
+                        seen = 0
+                        async for item in iter_json_items(response, "results.item"):
+                            # A retried page skips the items it already queued
+                            seen += 1
+                            if seen > queued:
+                                queued = seen
+                                await items.put(item)
+            
+            try:
+                async with semaphore:
+                    await with_retries(request)
+            except httpx.HTTPError as e:
+                self.logger.error(f"HTTP error fetching FEC data (page {page}): {e}")
+                self.stats["errors"] += 1
+            except Exception as e:
+                # e.g. a malformed body; the page's remaining items are lost
+                self.logger.error(f"Error streaming FEC data (page {page}): {e}")
+                self.stats["errors"] += 1
+            finally:
+                # A cancelled page's consumer is gone; waiting for room in
+                # a full queue would hang the task
+                if not asyncio.current_task().cancelling():
+                    await items.put(None)
+        
+        if max_pages is not None and max_pages < 1:
+            self.logger.info(f"Reached max_pages limit ({max_pages})")
+            return
+        
+        # The first page tells us how many pages there are, so it is
+        # read whole for its pagination block
+        data = await fetch_page(1)
+        if data is None:
+            return
+        
+        results = data.get("results", [])
+        if not results:
+            self.logger.info("No more results")
+            return
+        
+        for item in results:
+            yield item
+        
+        total_pages = data.get("pagination", {}).get("pages", 0)
+        last_page = total_pages if max_pages is None else min(total_pages, max_pages)
+        if last_page <= 1:
+            self.logger.info(f"Reached last page ({total_pages})")
+            return
+        if last_page < total_pages:
+            self.logger.info(f"Reached max_pages limit ({max_pages})")
+        
+        # Stream the remaining pages concurrently; contributions are
+        # yielded as they are parsed instead of after each whole page
+        tasks = [asyncio.create_task(stream_page(page)) for page in range(2, last_page + 1)]
+        pages_left = len(tasks)
+        try:
+            while pages_left:
+                item = await items.get()
+                if item is None:
+                    pages_left -= 1
+                    continue
+                yield item
+        finally:
+            # Don't leave requests running if the consumer stops early
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
     
-    async def transform(self, raw: dict) -> Contribution:
+    async def transform(self, raw: dict[str, Any]) -> Contribution:
         """
         Transform FEC API response to Contribution model.
         
+        The ingest pipeline itself uses _transform_to_dict() and never
+        builds the model; this is for callers that want a Contribution.
+        
+        Args:
+            raw: Raw FEC API contribution dict
+        
+        Returns:
+            Contribution model
+        """
+        # Validated, so amount becomes the declared Decimal; this is off
+        # the ingest path, which keeps the float for MongoDB
+        return Contribution.model_validate(self._extract_fields(raw))
+    
+    def _transform_to_dict(self, raw: dict[str, Any]) -> dict[str, Any]:
+        """
+        Transform FEC API response straight to a MongoDB document.
+        
+        Args:
+            raw: Raw FEC API contribution dict
+            
+        Returns:
+            Normalized document ready for $set
+        """
+        return self._to_document(self._extract_fields(raw))
+    
+    def _extract_fields(self, raw: dict[str, Any]) -> dict[str, Any]:
+        """
+        Pull Contribution fields out of an FEC Schedule A record.
+        
         FEC API returns Schedule A (itemized receipts) data.
         Field mapping: https://api.open.fec.gov/developers/
         
@@ -171,36 +394,32 @@ class FECIngester(BaseIngester[Contribution]):
             raw: Raw FEC API contribution dict
         
         Returns:
-            Contribution model
+            Contribution fields (not yet converted for MongoDB)
         """
         # Parse date (FEC returns ISO format: "2024-03-15T00:00:00")
         date_str = raw.get("contribution_receipt_date")
-        contrib_date = datetime.fromisoformat(date_str.replace("Z", "")).date() if date_str else date.today()
+        contrib_date = _parse_fec_date(date_str) if date_str else date.today()
         
-        # Amount - FIXED: handle None/empty values properly
+        # Amount - parsed straight to float, which is what MongoDB stores
         amount_raw = raw.get("contribution_receipt_amount")
         if amount_raw is None or amount_raw == "":
-            amount = Decimal("0")
+            amount = 0.0
             self.logger.debug(f"Missing amount for contribution, using 0")
         else:
             try:
-                amount = Decimal(str(amount_raw))
-            except (ValueError, TypeError, decimal.InvalidOperation) as e:
+                amount = float(amount_raw)
+            except (ValueError, TypeError) as e:
                 self.logger.warning(f"Invalid amount '{amount_raw}': {e}, using 0")
-                amount = Decimal("0")
+                amount = 0.0
         
         # Determine contribution type
-        entity_type = raw.get("entity_type", "")
-        if entity_type == "IND":
-            contrib_type = ContributionType.INDIVIDUAL
-        elif entity_type in ["PAC", "COM"]:
-            contrib_type = ContributionType.PAC
-        elif entity_type == "PTY":
-            contrib_type = ContributionType.PARTY
-        elif entity_type == "CAN":
-            contrib_type = ContributionType.CANDIDATE
-        else:
-            contrib_type = ContributionType.OTHER
+        contrib_type = _ENTITY_MAP.get(raw.get("entity_type"), ContributionType.OTHER)
+        
+        # Passthrough fields (every Schedule A record normally has them all)
+        try:
+            passthrough = dict(zip(_FEC_FIELDS, _FEC_GETTER(raw)))
+        except KeyError:
+            passthrough = {field: raw.get(field) for field in _FEC_FIELDS}
         
         # Build unique ID
         sub_id = raw.get("sub_id", "")
@@ -209,47 +428,121 @@ class FECIngester(BaseIngester[Contribution]):
         # Get recipient name (use cached name if not in record)
         recipient_name = raw.get("candidate_name") or self.candidate_name or "Unknown Candidate"
         
-        return Contribution(
-            id=contrib_id,
-            recipient_name=recipient_name,
-            recipient_id=None,  # FEC doesn't provide CRP ID
-            bioguide_id=self.bioguide_id,  # FIXED: Use the bioguide_id passed to constructor
-            committee_id=raw.get("committee_id"),
-            contributor_name=raw.get("contributor_name") or "Unknown",
-            contributor_type=contrib_type,
-            contributor_employer=raw.get("contributor_employer"),
-            contributor_occupation=raw.get("contributor_occupation"),
-            contributor_city=raw.get("contributor_city"),
-            contributor_state=raw.get("contributor_state"),
-            contributor_zip=raw.get("contributor_zip"),
-            amount=amount,
-            contribution_date=contrib_date,
-            industry_code=None,  # FEC doesn't categorize by industry
-            industry_name=None,
-            sector_code=None,
-            sector_name=None,
-            cycle=str(raw.get("two_year_transaction_period", "")),
-            source="fec",
-            fec_transaction_id=raw.get("transaction_id"),
-            last_updated=date.today()
-        )
+        return {
+            "id": contrib_id,
+            "recipient_name": recipient_name,
+            "recipient_id": None,  # FEC doesn't provide CRP ID
+            "bioguide_id": self.bioguide_id,  # FIXED: Use the bioguide_id passed to constructor
+            "contributor_name": raw.get("contributor_name") or "Unknown",
+            "contributor_type": contrib_type,
+            **passthrough,
+            "amount": amount,
+            "contribution_date": contrib_date,
+            "industry_code": None,  # FEC doesn't categorize by industry
+            "industry_name": None,
+            "sector_code": None,
+            "sector_name": None,
+            "cycle": str(raw.get("two_year_transaction_period", "")),
+            "source": "fec",
+            "fec_transaction_id": raw.get("transaction_id"),
+            "last_updated": self.batch_timestamp().date()
+        }
     
-    async def load(self, contribution: Contribution) -> bool:
+    async def load(self, contribution: Contribution) -> None:
         """
-        Upsert contribution into MongoDB.
+        Queue a contribution upsert for the next bulk_write batch.
         
         Args:
             contribution: Contribution model
+        """
+        await self._queue_document(self._to_document(contribution.model_dump()))
+    
+    async def process_item(self, raw_item: dict[str, Any]):
+        """
+        Process a single contribution without the Contribution model round-trip.
         
-        Returns:
-            True if new insert, False if update
+        Args:
+            raw_item: Raw FEC API contribution dict
+        """
+        try:
+            self.stats["processed"] += 1
+            await self._queue_document(self._transform_to_dict(raw_item))
+        except Exception as e:
+            self.stats["errors"] += 1
+            self.logger.error(f"Error processing item: {e}", exc_info=True)
+    
+    async def _queue_document(self, contrib_data: dict[str, Any]):
+        """
+        Queue a prepared contribution document.
+        
+        Documents are collected and split at flush time: new ones are
+        inserted with insert_many, existing ones are upserted.
+        """
+        self._pending_docs.append(contrib_data)
+        if len(self._pending_docs) >= self.batch_size:
+            await self.flush_writes("contributions")
+    
+    async def _write_pending_docs(self):
+        """
+        Insert new contributions with one unordered insert_many.
+        
+        Most fetched contributions are new, and plain inserts are cheaper
+        than upserts. Contributions whose id is already stored (or that
+        collide on insert) are queued as content-guarded upserts instead,
+        which relies on the unique idx_contribution_id index.
         """
-        collection = self.db.contributions
+        docs, self._pending_docs = self._pending_docs, []
+        if not docs:
+            return
         
-        # Convert to dict
-        contrib_data = contribution.model_dump()
+        existing = set(await self.db.contributions.distinct(
+            "id", {"id": {"$in": [doc["id"] for doc in docs]}}
+        ))
+        updates = [doc for doc in docs if doc["id"] in existing]
+        inserts = [doc for doc in docs if doc["id"] not in existing]
         
-        # Convert Decimal to float for MongoDB
+        if inserts:
+            for doc in inserts:
+                doc["_doc_hash"] = content_hash(doc)
+            try:
+                result = await self.db.contributions.insert_many(inserts, ordered=False)
+                self.stats["inserted"] += len(result.inserted_ids)
+            except BulkWriteError as e:
+                self.stats["inserted"] += e.details.get("nInserted", 0)
+                write_errors = e.details.get("writeErrors", [])
+                # Only a duplicate id means "already stored"; a duplicate on
+                # another unique index is a real conflict
+                duplicates = [
+                    err["index"] for err in write_errors
+                    if err.get("code") == DUPLICATE_KEY_ERROR
+                    and set(err.get("keyPattern", ())) == {"id"}
+                ]
+                failed = len(write_errors) - len(duplicates)
+                if failed:
+                    self.logger.error(f"Contribution insert had {failed} failed document(s)")
+                    self.stats["errors"] += failed
+                updates.extend(inserts[index] for index in duplicates)
+        
+        for doc in updates:
+            doc.pop("_id", None)  # Added by insert_many; can't $set _id
+            await self.queue_upsert_if_changed("contributions", {"id": doc["id"]}, doc)
+    
+    async def flush_writes(self, collection_name: Optional[str] = None):
+        """Write pending contribution documents, then flush queued writes."""
+        await self._write_pending_docs()
+        await super().flush_writes(collection_name)
+    
+    def _to_document(self, contrib_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Convert Contribution fields into the normalized MongoDB document.
+        
+        Args:
+            contrib_data: Contribution fields (or Contribution.model_dump())
+            
+        Returns:
+            Document ready for $set
+        """
+        # Convert Decimal (from a validated Contribution) to float for MongoDB
         if isinstance(contrib_data.get('amount'), Decimal):
             contrib_data['amount'] = float(contrib_data['amount'])
         
@@ -272,16 +565,7 @@ class FECIngester(BaseIngester[Contribution]):
         
         # ✨ NORMALIZE the contribution data before saving
         # This ensures consistent formats for contributor_state
-        normalized_data = normalize_contribution(contrib_data)
-        
-        # Upsert by contribution ID
-        result = await collection.update_one(
-            {"id": contribution.id},
-            {"$set": normalized_data},
-            upsert=True
-        )
-        
-        return result.upserted_id is not None
+        return normalize_contribution(contrib_data)
 
 
 async def get_candidate_fec_id(bioguide_id: str, db) -> Optional[str]:
@@ -0,0 +1,287 @@
+"""
+Shared HTTP helpers for the ingesters.
+
+- get_http_client(): shared pooled httpx.AsyncClient for all ingesters
+- parse_json(): decode JSON response bodies
+- iter_json_items(): decode the items of a JSON array from a streamed response
+- with_retries(): retry transient HTTP failures with backoff and jitter
+- ResponseCache: on-disk cache for ETag / Last-Modified conditional GETs
+
+orjson is optional: when installed (pip install orjson) JSON response
+bodies are decoded with it, otherwise httpx's stdlib json is used.
+HTTP/2 is likewise only enabled when h2 is installed (pip install httpx[http2]).
+With ijson installed (pip install ijson) iter_json_items() parses while the
+body downloads; without it the body is read first and decoded in one go.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import time
+from pathlib import Path
+from typing import AsyncGenerator, Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - needed by httpx for http2=True
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# ============================================================
+# Shared async client
+# ============================================================
+
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared pooled AsyncClient.
+    
+    Reusing one client keeps connections (and TLS sessions) warm across
+    pages, ingester runs and ingesters. A new client is created if the
+    previous one was closed or belongs to another event loop.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0
+            ),
+            http2=HTTP2_AVAILABLE
+        )
+        _http_client_loop = loop
+        logger.debug(f"Created shared HTTP client (HTTP/2 {'enabled' if HTTP2_AVAILABLE else 'unavailable'})")
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared AsyncClient (call once at the end of a script)."""
+    global _http_client, _http_client_loop
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        _http_client_loop = None
+
+
+def parse_json(response: httpx.Response):
+    """
+    Decode a JSON response body.
+
+    Args:
+        response: httpx response with a JSON body
+
+    Returns:
+        Decoded JSON (dict or list)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+class _AsyncResponseReader:
+    """Minimal async file-like view of a streamed response body for ijson."""
+    
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+    
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream with read(0), which must not consume a
+        # chunk; otherwise it accepts chunks of any length and b"" ends it
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
+
+async def iter_json_items(response: httpx.Response, prefix: str) -> AsyncGenerator:
+    """
+    Yield the items of a JSON array in a streamed response body.
+    
+    Args:
+        response: Response opened with client.stream()
+        prefix: ijson path of the array items, e.g. "results.item"
+        
+    Yields:
+        Each decoded array item
+    """
+    if IJSON_AVAILABLE:
+        async for item in ijson.items_async(_AsyncResponseReader(response), prefix, use_float=True):
+            yield item
+        return
+    
+    await response.aread()
+    data = parse_json(response)
+    for key in prefix.split(".")[:-1]:  # last part is "item"
+        data = data.get(key) or {}
+    for item in data or []:
+        yield item
+
+
+# ============================================================
+# Retries
+# ============================================================
+
+# Statuses worth retrying: rate limited or a temporary server-side failure
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_retryable(error: httpx.HTTPError) -> bool:
+    """True for connection/timeout errors and retryable status codes."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRY_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
+
+
+def retry_delay(attempt: int, error: httpx.HTTPError, base: float = 0.2, cap: float = 10.0) -> float:
+    """
+    Seconds to wait before retry number `attempt` (1-based).
+    
+    A Retry-After header (in seconds) is honored as given; otherwise the
+    delay is exponential backoff with full jitter, capped at `cap`.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        retry_after = error.response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+async def with_retries(request: Callable[[], Awaitable[T]], attempts: int = 6) -> T:
+    """
+    Await request(), retrying transient HTTP failures.
+    
+    Args:
+        request: Coroutine factory making one attempt; it should call
+                 raise_for_status() so error statuses raise
+        attempts: Total attempts before the last error is re-raised
+        
+    Returns:
+        The result of the first successful attempt
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return await request()
+        except httpx.HTTPError as e:
+            if attempt == attempts or not is_retryable(e):
+                raise
+            delay = retry_delay(attempt, e)
+            logger.warning(f"{e} - retrying in {delay:.1f}s (attempt {attempt}/{attempts})")
+            await asyncio.sleep(delay)
+
+
+class ResponseCache:
+    """
+    On-disk cache of HTTP response bodies for conditional GETs.
+    
+    Each entry keeps the body with its ETag / Last-Modified headers, so a
+    repeat request can send If-None-Match / If-Modified-Since and reuse
+    the stored body on a 304. Entries younger than ttl seconds are used
+    without contacting the server at all.
+    
+    Usage:
+        cache = ResponseCache(Path(HTTP_CACHE_DIR) / "congress_gov", ttl=3600)
+        key = cache.key(url, params)
+        entry = cache.get(key)
+        if entry and cache.is_fresh(entry):
+            return entry["body"]
+        response = client.get(url, params=params, headers=cache.conditional_headers(entry))
+        if response.status_code == 304 and entry:
+            cache.touch(key, entry)
+        else:
+            entry = cache.store(key, response)
+    """
+    
+    def __init__(self, cache_dir: Path, ttl: Optional[float] = None):
+        """
+        Args:
+            cache_dir: Directory holding the cache files
+            ttl: Seconds an entry is used without revalidation
+                 (None = always revalidate with the server)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+    
+    def key(self, url: str, params: Optional[dict] = None) -> str:
+        """Build a cache key from the URL and query params (API keys excluded)."""
+        query = sorted(
+            (k, str(v)) for k, v in (params or {}).items()
+            if k != "api_key"
+        )
+        return hashlib.sha256(f"{url}?{query}".encode()).hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[dict]:
+        """Load a cache entry, or None if missing/unreadable."""
+        try:
+            return json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+    
+    def is_fresh(self, entry: dict) -> bool:
+        """True if the entry can be used without asking the server."""
+        return self.ttl is not None and time.time() - entry["stored_at"] < self.ttl
+    
+    def conditional_headers(self, entry: Optional[dict]) -> dict:
+        """Headers that make a request conditional on a cached entry."""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+    
+    def store(self, key: str, response: httpx.Response, body=None) -> dict:
+        """
+        Save a successful response and return the new entry.
+        
+        Args:
+            key: Cache key from key()
+            response: The 200 response (for its validators)
+            body: JSON-serializable value to keep instead of the response
+                  text, e.g. data already parsed from it
+        """
+        entry = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "stored_at": time.time(),
+            "body": response.text if body is None else body,
+        }
+        self._write(key, entry)
+        return entry
+    
+    def touch(self, key: str, entry: dict):
+        """Mark an entry as revalidated (after a 304)."""
+        entry["stored_at"] = time.time()
+        self._write(key, entry)
+    
+    def _write(self, key: str, entry: dict):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._path(key).write_text(json.dumps(entry), encoding="utf-8")
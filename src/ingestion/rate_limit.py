@@ -0,0 +1,52 @@
+"""
+Async rate limiting for external APIs.
+
+A small token-bucket limiter so concurrent requests can share one API
+rate limit instead of sleeping a fixed delay after every request.
+
+Usage:
+    async with CONGRESS_GOV_LIMITER:
+        response = await client.get(url, params=params)
+"""
+import asyncio
+import time
+
+from src.config.constants import CONGRESS_GOV_RATE_LIMIT, FEC_RATE_LIMIT
+
+
+class AsyncLimiter:
+    """
+    Token bucket allowing max_rate acquisitions per time_period seconds.
+
+    The bucket starts full, so short runs are not slowed down; sustained
+    runs are paced to the average rate. Reservations are made without
+    awaiting, so one limiter can be shared across tasks and event loops.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._interval = time_period / max_rate
+        self._tat = 0.0  # Theoretical arrival time of the next request
+
+    async def acquire(self):
+        """Wait until a request is allowed under the rate limit."""
+        now = time.monotonic()
+        self._tat = max(self._tat, now) + self._interval
+        delay = self._tat - now - self.time_period
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+# Shared by every ingester that calls Congress.gov with our API key
+CONGRESS_GOV_LIMITER = AsyncLimiter(CONGRESS_GOV_RATE_LIMIT, 3600)
+
+# Shared by every FEC ingester (one api.open.fec.gov key)
+FEC_LIMITER = AsyncLimiter(FEC_RATE_LIMIT, 3600)
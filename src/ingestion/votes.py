@@ -5,20 +5,59 @@ Fetches votes from Congress.gov and individual member positions
 from House Clerk XML files.
 """
 import asyncio
+import functools
+import json
 import httpx
-import xml.etree.ElementTree as ET
+from io import BytesIO
+from pymongo import UpdateOne
 from typing import AsyncGenerator, Optional
 from datetime import date, datetime
+from pathlib import Path
 import logging
 
+from src.database.indexes import create_politician_votes_indexes, create_votes_indexes
 from src.ingestion.base import BaseIngester
+from src.ingestion.http_client import (
+    RETRY_STATUS_CODES,
+    ResponseCache,
+    close_http_client,
+    get_http_client,
+    parse_json,
+    with_retries,
+)
+from src.ingestion.rate_limit import CONGRESS_GOV_LIMITER, AsyncLimiter
 from src.models.legislation import Vote, PoliticianVote
 from src.config.settings import settings
-from src.config.constants import CONGRESS_GOV_BASE_URL, CURRENT_CONGRESS
+from src.config.constants import CONGRESS_GOV_BASE_URL, CURRENT_CONGRESS, HTTP_CACHE_DIR
+
+# lxml (libxml2) parses Clerk XML much faster; fall back to the
+# API-compatible stdlib ElementTree when it isn't installed
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> Optional[date]:
+    """
+    Parse a Congress.gov date ("2025-01-03T12:34:00-05:00" or "2025-01-03").
+    
+    Cached because many votes share a date.
+    """
+    try:
+        if "T" in date_str:
+            # fromisoformat accepts offsets and "Z" (Python 3.11+)
+            return datetime.fromisoformat(date_str).date()
+        return date.fromisoformat(date_str[:10])
+    except ValueError:
+        return None
+
+
 class VotesIngester(BaseIngester[Vote]):
     """
     Ingest roll call votes from Congress.gov.
@@ -26,12 +65,26 @@ class VotesIngester(BaseIngester[Vote]):
     Fetches vote events and individual member positions from House Clerk XML.
     """
     
+    # Vote detail + Clerk XML fetches in flight at once
+    request_concurrency: int = 10
+    
+    # Votes and member positions are upserted by vote_id and
+    # (vote_id, bioguide_id); connect() refuses to run without these
+    required_indexes = (create_votes_indexes, create_politician_votes_indexes)
+    
     def __init__(self, congress: int = CURRENT_CONGRESS):
         super().__init__()
         self.congress = congress
         self.api_key = settings.CONGRESS_GOV_API_KEY
         self.base_url = CONGRESS_GOV_BASE_URL
         
+        # Vote listings and parsed Clerk XML, revalidated with
+        # ETag / Last-Modified so unchanged data isn't downloaded again
+        self.cache = ResponseCache(Path(HTTP_CACHE_DIR) / "votes")
+        
+        # Set once the first transformed vote passed full validation
+        self._vote_validated = False
+        
     async def fetch_data(
         self,
         chamber: str = "house",  # Currently only "house" is supported
@@ -60,95 +113,241 @@ class VotesIngester(BaseIngester[Vote]):
         
         total_fetched = 0
         
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            for sess in sessions_to_fetch:
-                self.logger.info(f"Fetching session {sess} votes...")
-                
-                offset = 0
-                batch_size = 250
-                
-                while True:
-                    try:
-                        # Use the correct beta endpoint
-                        url = f"{self.base_url}/house-vote/{self.congress}/{sess}"
-                        params = {
-                            "api_key": self.api_key,
-                            "format": "json",
-                            "limit": batch_size,
-                            "offset": offset
-                        }
-                        
-                        self.logger.info(f"Fetching session {sess} votes {offset}-{offset+batch_size}...")
-                        response = await client.get(url, params=params)
-                        
+        client = get_http_client()
+        semaphore = asyncio.Semaphore(self.request_concurrency)
+        
+        async def fetch_vote(vote_summary: dict) -> Optional[dict]:
+            async with semaphore:
+                return await self._fetch_vote(vote_summary, client)
+        
+        for sess in sessions_to_fetch:
+            self.logger.info(f"Fetching session {sess} votes...")
+            
+            offset = 0
+            batch_size = 250
+            
+            # Use the correct beta endpoint
+            url = f"{self.base_url}/house-vote/{self.congress}/{sess}"
+            params = {
+                "api_key": self.api_key,
+                "format": "json",
+                "limit": batch_size,
+                "offset": offset
+            }
+            
+            while True:
+                try:
+                    self.logger.info(f"Fetching session {sess} votes {offset}-{offset+batch_size}...")
+                    cache_key = self.cache.key(url, params)
+                    entry = self.cache.get(cache_key)
+                    response = await self._get(
+                        client,
+                        url,
+                        limiter=CONGRESS_GOV_LIMITER,
+                        params=params,
+                        headers=self.cache.conditional_headers(entry)
+                    )
+                    
+                    if response.status_code == 304 and entry:
+                        self.cache.touch(cache_key, entry)
+                        data = json.loads(entry["body"])
+                    else:
                         if response.status_code == 404:
                             self.logger.info(f"No more votes for session {sess}")
                             break
                         
                         response.raise_for_status()
-                        data = response.json()
-                        
-                        votes = data.get("houseRollCallVotes", [])
-                        if not votes:
-                            self.logger.info(f"No more votes for session {sess}")
-                            break
-                        
-                        self.logger.info(f"Found {len(votes)} votes in batch")
-                        
-                        # Process each vote
-                        for vote_summary in votes:
-                            try:
-                                # Get full vote details from the URL
-                                vote_url = vote_summary.get("url")
-                                if vote_url:
-                                    detail_params = {
-                                        "api_key": self.api_key,
-                                        "format": "json"
-                                    }
-                                    
-                                    detail_response = await client.get(vote_url, params=detail_params)
-                                    
-                                    if detail_response.status_code == 200:
-                                        vote_detail = detail_response.json().get("houseRollCallVote", {})
-                                        
-                                        # Fetch member votes from House Clerk XML
-                                        source_xml_url = vote_detail.get("sourceDataURL")
-                                        if source_xml_url:
-                                            try:
-                                                xml_response = await client.get(source_xml_url)
-                                                if xml_response.status_code == 200:
-                                                    # Parse XML to extract member votes
-                                                    member_votes = self._parse_house_clerk_xml(xml_response.text)
-                                                    vote_detail["memberVotes"] = member_votes
-                                                    self.logger.info(f"Fetched {len(member_votes)} member votes from XML")
-                                            except Exception as e:
-                                                self.logger.warning(f"Could not fetch member votes XML: {e}")
-                                        
-                                        yield vote_detail
-                                        
-                                        total_fetched += 1
-                                        
-                                        if limit and total_fetched >= limit:
-                                            self.logger.info(f"Reached limit of {limit} votes")
-                                            return
-                                        
-                                        await asyncio.sleep(0.3)
-                                        
-                            except Exception as e:
-                                self.logger.error(f"Error fetching vote details: {e}")
-                                self.stats["errors"] += 1
-                        
-                        offset += batch_size
-                        await asyncio.sleep(0.5)
-                        
-                    except httpx.HTTPError as e:
-                        self.logger.error(f"HTTP error: {e}")
-                        self.stats["errors"] += 1
+                        data = parse_json(response)
+                        self.cache.store(cache_key, response)
+                    
+                    votes = data.get("houseRollCallVotes", [])
+                    if not votes:
+                        self.logger.info(f"No more votes for session {sess}")
                         break
-                    except Exception as e:
-                        self.logger.error(f"Error: {e}")
-                        self.stats["errors"] += 1
+                    
+                    self.logger.info(f"Found {len(votes)} votes in batch")
+                    
+                    # Fetch details + member votes for the batch concurrently
+                    changed = await self._changed_votes(votes)
+                    pending = changed[:limit - total_fetched] if limit else changed
+                    tasks = [asyncio.create_task(fetch_vote(v)) for v in pending]
+                    try:
+                        for next_vote in asyncio.as_completed(tasks):
+                            vote_detail = await next_vote
+                            if vote_detail is None:
+                                continue
+                            
+                            yield vote_detail
+                            
+                            total_fetched += 1
+                            
+                            if limit and total_fetched >= limit:
+                                self.logger.info(f"Reached limit of {limit} votes")
+                                return
+                    finally:
+                        # Don't leave requests running if the consumer stops early
+                        for task in tasks:
+                            task.cancel()
+                        await asyncio.gather(*tasks, return_exceptions=True)
+                    
+                    # A partial page is the last one; no need to ask for more
+                    if len(votes) < batch_size:
+                        self.logger.info(f"No more votes for session {sess}")
                         break
+                    
+                    offset += batch_size
+                    
+                    # Follow the API's next-page link when it gives one
+                    next_url = data.get("pagination", {}).get("next")
+                    if next_url:
+                        url = next_url
+                        params = {"api_key": self.api_key}
+                    else:
+                        params["offset"] = offset
+                    
+                except httpx.HTTPError as e:
+                    self.logger.error(f"HTTP error: {e}")
+                    self.stats["errors"] += 1
+                    break
+                except Exception as e:
+                    self.logger.error(f"Error: {e}")
+                    self.stats["errors"] += 1
+                    break
+
+    async def _changed_votes(self, votes: list[dict]) -> list[dict]:
+        """
+        Drop listing entries whose vote is stored with the same updateDate.
+        
+        Their details and Clerk XML haven't changed since they were
+        saved, so fetching them again would only rewrite the same data.
+        
+        Args:
+            votes: Entries from the house-vote listing
+            
+        Returns:
+            Entries that are new or updated since they were saved
+        """
+        vote_ids = [
+            f"house-roll-{v.get('rollCallNumber')}-{v.get('congress')}" for v in votes
+        ]
+        stored = {
+            doc["vote_id"]: doc.get("update_date")
+            async for doc in self.db.votes.find(
+                {"vote_id": {"$in": vote_ids}},
+                {"_id": 0, "vote_id": 1, "update_date": 1}
+            )
+        }
+        
+        changed = [
+            vote for vote, vote_id in zip(votes, vote_ids)
+            if not vote.get("updateDate") or stored.get(vote_id) != vote.get("updateDate")
+        ]
+        if len(changed) < len(votes):
+            self.logger.info(f"Skipping {len(votes) - len(changed)} unchanged votes")
+        return changed
+    
+    async def _fetch_vote(self, vote_summary: dict, client: httpx.AsyncClient) -> Optional[dict]:
+        """
+        Fetch one vote's details and its member votes.
+        
+        Args:
+            vote_summary: Vote entry from the house-vote listing
+            client: HTTP client to use
+            
+        Returns:
+            Vote detail with memberVotes added, or None if unavailable
+        """
+        try:
+            # Get full vote details from the URL
+            vote_url = vote_summary.get("url")
+            if not vote_url:
+                return None
+            
+            detail_params = {
+                "api_key": self.api_key,
+                "format": "json"
+            }
+            
+            detail_response = await self._get(
+                client,
+                vote_url,
+                limiter=CONGRESS_GOV_LIMITER,
+                params=detail_params
+            )
+            
+            if detail_response.status_code != 200:
+                return None
+            
+            vote_detail = parse_json(detail_response).get("houseRollCallVote", {})
+            
+            # Keep the listing's updateDate; _changed_votes() compares to it
+            if vote_summary.get("updateDate"):
+                vote_detail["updateDate"] = vote_summary["updateDate"]
+            
+            # Fetch member votes from House Clerk XML; the parsed votes
+            # are cached, so an unchanged file (304) is not parsed again
+            source_xml_url = vote_detail.get("sourceDataURL")
+            if source_xml_url:
+                try:
+                    cache_key = self.cache.key(source_xml_url)
+                    entry = self.cache.get(cache_key)
+                    xml_response = await self._get(
+                        client,
+                        source_xml_url,
+                        headers=self.cache.conditional_headers(entry)
+                    )
+                    if xml_response.status_code == 304 and entry:
+                        self.cache.touch(cache_key, entry)
+                        vote_detail["memberVotes"] = entry["body"]
+                        self.logger.debug(f"Member votes XML unchanged: {source_xml_url}")
+                    elif xml_response.status_code == 200:
+                        # Parse XML off the event loop so other fetches keep
+                        # going (lxml releases the GIL while parsing)
+                        member_votes = await asyncio.to_thread(
+                            self._parse_house_clerk_xml, xml_response.content
+                        )
+                        if member_votes:
+                            self.cache.store(cache_key, xml_response, body=member_votes)
+                        vote_detail["memberVotes"] = member_votes
+                        self.logger.info(f"Fetched {len(member_votes)} member votes from XML")
+                except Exception as e:
+                    self.logger.warning(f"Could not fetch member votes XML: {e}")
+            
+            return vote_detail
+            
+        except Exception as e:
+            self.logger.error(f"Error fetching vote details: {e}")
+            self.stats["errors"] += 1
+            return None
+    
+    async def _get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        limiter: Optional[AsyncLimiter] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        GET a URL, retrying 429s and transient server errors.
+        
+        Other statuses (200, 304, 404, ...) are returned for the caller
+        to handle; HTTPError is raised once the retries are used up.
+        
+        Args:
+            client: HTTP client to use
+            url: URL to fetch
+            limiter: Rate limiter to pass before each attempt
+            **kwargs: Passed to client.get()
+        """
+        async def request() -> httpx.Response:
+            if limiter is not None:
+                await limiter.acquire()
+            response = await client.get(url, **kwargs)
+            if response.status_code in RETRY_STATUS_CODES:
+                response.raise_for_status()
+            return response
+        
+        return await with_retries(request)
     
     async def transform(self, raw: dict) -> Vote:
         """
@@ -174,7 +373,7 @@ class VotesIngester(BaseIngester[Vote]):
         
         # Get vote date from startDate
         start_date_str = raw.get("startDate")
-        vote_date = self._parse_date(start_date_str)
+        vote_date = _parse_date(start_date_str) if start_date_str else None
         
         # Get counts from party totals
         party_totals = raw.get("votePartyTotal", [])
@@ -198,33 +397,47 @@ class VotesIngester(BaseIngester[Vote]):
             bill_type = legislation_type.lower()
             bill_id = f"{bill_type}-{legislation_number}-{congress}"
         
-        return Vote(
-            vote_id=vote_id,
-            bill_id=bill_id,
-            chamber="house",
-            congress=int(congress),
-            session=int(session),
-            roll_number=int(roll_number),
-            question=question,
-            result=result,
-            vote_date=vote_date,
-            yea_count=int(yea_count),
-            nay_count=int(nay_count),
-            present_count=int(present_count),
-            not_voting_count=int(not_voting_count),
-            congress_gov_url=raw.get("legislationUrl"),
-            last_updated=datetime.utcnow()
-        )
+        fields = {
+            "vote_id": vote_id,
+            "bill_id": bill_id,
+            "chamber": "house",
+            "congress": int(congress),
+            "session": int(session),
+            "roll_number": int(roll_number),
+            "question": question,
+            "result": result,
+            "vote_date": vote_date,
+            "yea_count": int(yea_count),
+            "nay_count": int(nay_count),
+            "present_count": int(present_count),
+            "not_voting_count": int(not_voting_count),
+            "congress_gov_url": raw.get("legislationUrl"),
+            # Only recorded once member votes were saved too, so a vote
+            # whose XML failed is fetched again on the next run
+            "update_date": raw.get("updateDate") if raw.get("memberVotes") else None,
+            "last_updated": datetime.utcnow()
+        }
+        
+        # Every value is already typed above, so only the first vote of
+        # the run is validated (catches schema drift), the rest skip it
+        if not self._vote_validated:
+            Vote.model_validate(fields)
+            self._vote_validated = True
+        if vote_date is None:
+            raise ValueError(f"Missing vote date for {vote_id}")
+        
+        return Vote.model_construct(**fields)
     
-    async def load(self, vote: Vote) -> bool:
+    async def load(self, vote: Vote) -> None:
         """
-        Save vote and individual politician positions.
+        Queue an upsert of the vote event for the next bulk_write batch.
+        
+        The upsert skips votes whose content is unchanged (see
+        queue_upsert_if_changed); member positions are saved separately
+        by _save_member_positions().
         
         Args:
             vote: Vote model to save
-            
-        Returns:
-            True if new insert, False if update
         """
         # Convert to dict and handle date objects
         vote_data = vote.model_dump()
@@ -236,33 +449,35 @@ class VotesIngester(BaseIngester[Vote]):
                 datetime.min.time()
             )
         
-        # Save the vote event
-        collection = self.db.votes
-        
-        result = await collection.update_one(
-            {"vote_id": vote.vote_id},
-            {"$set": vote_data},
-            upsert=True
-        )
-        
-        return result.upserted_id is not None
+        # Save the vote event (unique idx_vote_id backs the guard)
+        await self.queue_upsert_if_changed("votes", {"vote_id": vote.vote_id}, vote_data)
     
     async def process_item(self, raw_data: dict) -> bool:
         """
         Override to also save individual politician votes.
         """
-        # Transform and save the vote
-        success = await super().process_item(raw_data)
-        
-        if success:
+        try:
+            self.stats["processed"] += 1
+            
+            # Transform and queue the vote (counted when the batch is flushed)
+            vote = await self.transform(raw_data)
+            await self.load(vote)
+            
             # Now save individual member positions
             await self._save_member_positions(raw_data)
-        
-        return success
+            
+            return True
+        except Exception as e:
+            self.stats["errors"] += 1
+            self.logger.error(f"Error processing item: {e}", exc_info=True)
+            return False
     
     async def _save_member_positions(self, raw_vote: dict):
         """
-        Save how each member voted.
+        Queue upserts of how each member voted.
+        
+        The upserts are sent with the next politician_votes bulk_write
+        batch and don't count towards the vote stats.
         
         Args:
             raw_vote: Raw vote data with member positions
@@ -278,59 +493,53 @@ class VotesIngester(BaseIngester[Vote]):
             self.logger.debug(f"No member positions found for {vote_id}")
             return
         
-        collection = self.db.politician_votes
+        # Rows are built as plain dicts (PoliticianVote fields); the
+        # parser's output is checked against the model once per vote
+        first_id, first_position = member_votes[0]
+        PoliticianVote(vote_id=vote_id, bioguide_id=first_id, position=first_position)
         
-        for member_vote in member_votes:
-            bioguide_id = member_vote.get("bioguideId")
-            position = member_vote.get("voteCast")  # "Aye", "No", "Present", "Not Voting"
-            
-            if not bioguide_id or not position:
-                continue
-            
-            politician_vote = PoliticianVote(
-                vote_id=vote_id,
-                bioguide_id=bioguide_id,
-                position=position
-            )
-            
-            await collection.update_one(
-                {"vote_id": vote_id, "bioguide_id": bioguide_id},
-                {"$set": politician_vote.model_dump()},
-                upsert=True
+        # (bioguide_id, position) pairs from _parse_house_clerk_xml()
+        for bioguide_id, position in member_votes:
+            await self.queue_write(
+                "politician_votes",
+                UpdateOne(
+                    {"vote_id": vote_id, "bioguide_id": bioguide_id},
+                    {"$set": {"vote_id": vote_id, "bioguide_id": bioguide_id, "position": position}},
+                    upsert=True
+                ),
+                is_item=False
             )
         
-        self.logger.info(f"Saved {len(member_votes)} member votes for {vote_id}")
-    
-    def _parse_date(self, date_str: Optional[str]) -> Optional[date]:
-        """Parse date string to date object."""
-        if not date_str:
-            return None
-        try:
-            # Handle different date formats
-            if "T" in date_str:
-                dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                return dt.date()
-            return date.fromisoformat(date_str[:10])
-        except:
-            return None
+        self.logger.info(f"Queued {len(member_votes)} member votes for {vote_id}")
     
-    def _parse_house_clerk_xml(self, xml_text: str) -> list:
+    def _parse_house_clerk_xml(self, xml_bytes: bytes) -> list[tuple[str, str]]:
         """
         Parse House Clerk XML to extract member votes.
         
+        The document is parsed in a single streaming pass; each
+        recorded-vote element is dropped once read, so the full tree
+        is never held in memory.
+        
         Args:
-            xml_text: XML content from clerk.house.gov
+            xml_bytes: Raw XML body from clerk.house.gov (bytes, so the
+                       parser handles the declared encoding itself)
             
         Returns:
-            List of dicts with bioguideId and voteCast
+            List of (bioguide_id, vote_cast) tuples; vote_cast is
+            "Aye", "No", "Present", "Not Voting", ...
         """
         try:
-            root = ET.fromstring(xml_text)
+            if LXML_AVAILABLE:
+                events = ET.iterparse(BytesIO(xml_bytes), tag="recorded-vote")
+            else:
+                events = ET.iterparse(BytesIO(xml_bytes))
             
             member_votes = []
             
-            # Find all recorded-vote elements
-            for recorded_vote in root.findall('.//recorded-vote'):
+            for _, recorded_vote in events:
+                if recorded_vote.tag != "recorded-vote":
+                    continue
+                
                 legislator = recorded_vote.find('legislator')
                 vote_elem = recorded_vote.find('vote')
                 
@@ -339,10 +548,13 @@ class VotesIngester(BaseIngester[Vote]):
                     vote_cast = vote_elem.text
                     
                     if bioguide_id and vote_cast:
-                        member_votes.append({
-                            'bioguideId': bioguide_id,
-                            'voteCast': vote_cast  # "Aye", "No", "Present", "Not Voting"
-                        })
+                        member_votes.append((bioguide_id, vote_cast))
+                
+                # Free the element (and, with lxml, the already-read siblings)
+                recorded_vote.clear()
+                if LXML_AVAILABLE:
+                    while recorded_vote.getprevious() is not None:
+                        del recorded_vote.getparent()[0]
             
             self.logger.debug(f"Parsed {len(member_votes)} member votes from XML")
             return member_votes
@@ -351,7 +563,6 @@ class VotesIngester(BaseIngester[Vote]):
             self.logger.error(f"Error parsing House Clerk XML: {e}")
             return []
 
-
 async def main():
     """CLI entry point for testing"""
     logging.basicConfig(level=logging.INFO)
@@ -360,6 +571,7 @@ async def main():
     
     # Fetch 20 recent House votes for testing
     stats = await ingester.run(chamber="house", limit=5)
+    await close_http_client()
     
     print("\n=== Sync Complete ===")
     print(f"Processed: {stats['processed']}")
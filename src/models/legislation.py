@@ -127,6 +127,7 @@ class Vote(BaseModel):
     congress_gov_url: Optional[str] = None
     
     # Metadata
+    update_date: Optional[str] = None  # Congress.gov updateDate of the stored data
     last_updated: datetime = Field(default_factory=datetime.utcnow)
 
 
@@ -1,64 +1,85 @@
 """
 Test forcing tool use with model_settings.
+
+Extra queries can be passed on the command line; all queries are run
+concurrently (at most MAX_CONCURRENT at a time).
 """
 import asyncio
+import sys
 from pydantic_ai import ModelSettings
-from src.agents.research_agent import research_agent
+from src.agents.research_agent import model_name, research_agent
 from src.agents.dependencies import get_agent_deps
+from src.agents.tool_inspect import extract_tool_calls, run_messages
 
-async def main():
-    print("Testing forced tool usage...\n")
+QUERIES = [
+    "Who is Mike Lee?",
+]
 
-    deps = await get_agent_deps()
+# Agent runs in flight at once (keeps us under provider rate limits)
+MAX_CONCURRENT = 4
 
-    query = "Who is Mike Lee?"
+# Characters of the response to show
+PREVIEW_CHARS = 200
 
-    # Try with tool_choice in model_settings
-    try:
-        model_settings = ModelSettings(
-            tool_choice='required'  # Force tool use
-        )
-
-        print(f"Query: {query}")
-        print("Model settings: tool_choice='required'\n")
-
-        result = await research_agent.run(
-            query,
-            deps=deps,
-            model_settings=model_settings
-        )
-
-        response = result.data if hasattr(result, 'data') else result.output
-        print(f"Response: {response[:200]}...\n")
-
-        # Check tool usage
-        tool_calls = []
-        if hasattr(result, 'all_messages'):
-            for msg in result.all_messages():
-                if hasattr(msg, 'parts'):
-                    for part in msg.parts:
-                        if hasattr(part, 'part_kind') and part.part_kind == 'tool-call':
-                            tool_calls.append(part.tool_name)
-
-        if tool_calls:
-            print(f"✅ Tools called: {', '.join(tool_calls)}")
-        else:
-            print("❌ No tools were called!")
+# Model families known to accept tool_choice='required'; others use 'auto'
+REQUIRED_TOOL_CHOICE_MODELS = ("claude-", "gpt-4o", "gpt-4.1")
 
+def pick_tool_choice(model):
+    """'required' if the model supports forcing tool use, else 'auto'."""
+    name = model.split(":", 1)[-1]  # Drop a provider prefix ("openai:gpt-4o")
+    return 'required' if name.startswith(REQUIRED_TOOL_CHOICE_MODELS) else 'auto'
+
+async def probe(query, deps, semaphore, model_settings):
+    # Run to completion: with run_stream() a text preamble before the
+    # tool_use block would end the run before any tool was called
+    try:
+        async with semaphore:
+            result = await research_agent.run(
+                query,
+                deps=deps,
+                model_settings=model_settings
+            )
     except Exception as e:
-        print(f"Error with tool_choice='required': {e}")
-        print("\nTrying with tool_choice='auto'...")
+        # Don't re-run with another tool_choice; that doubles the cost of a failure
+        print(f"Error with tool_choice='{model_settings['tool_choice']}' for {query!r}: {e}\n")
+        return []
+
+    print(f"Query: {query}")
+    print(f"Model settings: tool_choice='{model_settings['tool_choice']}'\n")
+
+    response = result.data if hasattr(result, 'data') else result.output
+    print(f"Response: {response[:PREVIEW_CHARS]}...\n")
+
+    # Check tool usage
+    tool_calls = extract_tool_calls(run_messages(result))
+
+    if tool_calls:
+        print(f"✅ Tools called: {', '.join(tool_calls)}")
+    else:
+        print("❌ No tools were called!")
+    print()
+
+    return tool_calls
+
+async def main(queries=None):
+    print("Testing forced tool usage...\n")
+
+    deps = await get_agent_deps()
+    queries = queries or QUERIES + sys.argv[1:]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
 
-        model_settings = ModelSettings(tool_choice='auto')
+    # Pick tool_choice once, from the model, instead of retrying on failure
+    model_settings = ModelSettings(tool_choice=pick_tool_choice(model_name))
+    print(f"Model: {model_name}\n")
 
-        result = await research_agent.run(
-            query,
-            deps=deps,
-            model_settings=model_settings
-        )
+    results = await asyncio.gather(
+        *(probe(query, deps, semaphore, model_settings) for query in queries),
+        return_exceptions=True
+    )
 
-        response = result.data if hasattr(result, 'data') else result.output
-        print(f"Response: {response[:200]}...")
+    for query, result in zip(queries, results):
+        if isinstance(result, Exception):
+            print(f"❌ Error for {query!r}: {result}")
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,45 +1,72 @@
 """
 Test research agent with direct tool call.
+
+Extra queries can be passed on the command line; all queries are run
+concurrently (at most MAX_CONCURRENT at a time).
 """
 import asyncio
+import sys
 from src.agents.research_agent import research_agent
 from src.agents.dependencies import get_agent_deps
+from src.agents.tool_inspect import extract_tool_calls, run_messages
 
-async def main():
-    print("Testing research agent tool calling...\n")
+# Very specific queries that require database lookup
+QUERIES = [
+    "Use the find_politician tool to search for politicians from Utah",
+]
 
-    deps = await get_agent_deps()
+# Agent runs in flight at once (keeps us under provider rate limits)
+MAX_CONCURRENT = 4
 
-    # Very specific query that requires database lookup
-    query = "Use the find_politician tool to search for politicians from Utah"
+# Characters of the response to show
+PREVIEW_CHARS = 300
 
-    print(f"Query: {query}\n")
+async def probe(query, deps, semaphore):
+    # Run to completion: with run_stream() a text preamble before the
+    # tool_use block would end the run before any tool was called
+    async with semaphore:
+        result = await research_agent.run(query, deps=deps)
 
-    result = await research_agent.run(query, deps=deps)
+    print(f"Query: {query}\n")
 
     response = result.data if hasattr(result, 'data') else result.output
-    print(f"Response: {response[:300]}...\n")
+    print(f"Response: {response[:PREVIEW_CHARS]}...\n")
 
     # Check tool usage
-    tool_calls = []
-    if hasattr(result, 'all_messages'):
-        for msg in result.all_messages():
-            if hasattr(msg, 'parts'):
-                for part in msg.parts:
-                    if hasattr(part, 'part_kind') and part.part_kind == 'tool-call':
-                        tool_calls.append(part.tool_name)
+    messages = run_messages(result)
+    tool_calls = extract_tool_calls(messages)
 
     if tool_calls:
         print(f"✅ Tools called: {', '.join(tool_calls)}")
     else:
         print("❌ No tools were called!")
 
-        # Debug: print message types
-        print("\nDebug - Message structure:")
-        if hasattr(result, 'all_messages'):
-            for i, msg in enumerate(result.all_messages()):
-                print(f"  Message {i}: kind={getattr(msg, 'kind', 'unknown')}, "
-                      f"parts={len(getattr(msg, 'parts', []))}")
+        # Debug: print message types (one write for the whole block)
+        lines = [
+            f"  Message {i}: kind={getattr(msg, 'kind', 'unknown')}, "
+            f"parts={len(getattr(msg, 'parts', []))}"
+            for i, msg in enumerate(messages)
+        ]
+        sys.stdout.write("\nDebug - Message structure:\n" + "\n".join(lines) + "\n")
+    print()
+
+    return tool_calls
+
+async def main(queries=None):
+    print("Testing research agent tool calling...\n")
+
+    deps = await get_agent_deps()
+    queries = queries or QUERIES + sys.argv[1:]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+
+    results = await asyncio.gather(
+        *(probe(query, deps, semaphore) for query in queries),
+        return_exceptions=True
+    )
+
+    for query, result in zip(queries, results):
+        if isinstance(result, Exception):
+            print(f"❌ Error for {query!r}: {result}")
 
 if __name__ == "__main__":
     asyncio.run(main())
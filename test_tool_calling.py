@@ -1,10 +1,17 @@
 """
 Minimal test to verify tool calling works with Pydantic AI and Claude.
+
+Extra prompts can be passed on the command line; all prompts are run
+concurrently (at most MAX_CONCURRENT at a time).
 """
 import asyncio
+import sys
+from datetime import datetime
 from pydantic_ai import Agent, RunContext
 from dotenv import load_dotenv
 
+from src.agents.tool_inspect import extract_tool_calls, run_messages
+
 load_dotenv()
 
 # Create a simple agent
@@ -13,38 +20,56 @@ agent = Agent(
     system_prompt='You are a helpful assistant. ALWAYS use your tools to answer questions.'
 )
 
+QUERIES = [
+    "What time is it?",
+]
+
+# Agent runs in flight at once (keeps us under provider rate limits)
+MAX_CONCURRENT = 4
+
 @agent.tool
 async def get_current_time(ctx: RunContext) -> str:
     """Get the current time. Use this tool whenever asked about the time."""
-    from datetime import datetime
     return datetime.now().strftime("%H:%M:%S")
 
-async def main():
-    print("Testing tool calling with Pydantic AI + Claude...\n")
+async def probe(query, semaphore):
+    async with semaphore:
+        result = await agent.run(query)
 
-    result = await agent.run("What time is it?")
+    print(f"Query: {query}")
 
     response = result.data if hasattr(result, 'data') else result.output
     print(f"Response: {response}\n")
 
     # Check if tools were called
-    tool_calls = []
-    if hasattr(result, 'all_messages'):
-        for msg in result.all_messages():
-            if hasattr(msg, 'parts'):
-                for part in msg.parts:
-                    if hasattr(part, 'part_kind') and part.part_kind == 'tool-call':
-                        tool_calls.append(part.tool_name)
+    messages = run_messages(result)
+    tool_calls = extract_tool_calls(messages)
 
     if tool_calls:
         print(f"✅ Tools called: {', '.join(tool_calls)}")
     else:
         print("❌ No tools were called!")
-        print("\nDebugging - all messages:")
-        if hasattr(result, 'all_messages'):
-            for i, msg in enumerate(result.all_messages()):
-                print(f"\nMessage {i}: {type(msg)}")
-                print(f"  {msg}")
+        # One write for the whole block
+        lines = [f"\nMessage {i}: {type(msg)}\n  {msg}" for i, msg in enumerate(messages)]
+        sys.stdout.write("\nDebugging - all messages:\n" + "\n".join(lines) + "\n")
+    print()
+
+    return tool_calls
+
+async def main(queries=None):
+    print("Testing tool calling with Pydantic AI + Claude...\n")
+
+    queries = queries or QUERIES + sys.argv[1:]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+
+    results = await asyncio.gather(
+        *(probe(query, semaphore) for query in queries),
+        return_exceptions=True
+    )
+
+    for query, result in zip(queries, results):
+        if isinstance(result, Exception):
+            print(f"❌ Error for {query!r}: {result}")
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,8 @@
+"""Shared test setup."""
+import os
+
+# Settings are validated on import; tests never reach these services
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017")
+os.environ.setdefault("MONGODB_DATABASE", "utah_watchdog_test")
+os.environ.setdefault("CONGRESS_GOV_API_KEY", "test-key")
+os.environ.setdefault("FEC_API_KEY", "test-key")
@@ -0,0 +1,87 @@
+"""Tests for BaseIngester's batched writes."""
+import asyncio
+from types import SimpleNamespace
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from src.ingestion.base import DUPLICATE_KEY_ERROR, BaseIngester
+
+
+class _FakeCollection:
+    """Collection whose bulk_write reports every op as an upsert."""
+    
+    async def bulk_write(self, ops, ordered=True):
+        return SimpleNamespace(upserted_count=len(ops), modified_count=0)
+
+
+class _Ingester(BaseIngester[dict]):
+    async def fetch_data(self, **kwargs):
+        yield {}
+    
+    async def transform(self, raw_data):
+        return raw_data
+    
+    async def load(self, item):
+        return None
+
+
+def _ingester(collection) -> _Ingester:
+    ingester = _Ingester()
+    ingester.db = {"votes": collection, "politician_votes": collection}
+    return ingester
+
+
+def test_non_item_upserts_do_not_count_as_inserts():
+    ingester = _ingester(_FakeCollection())
+    
+    async def run():
+        await ingester.queue_write("votes", UpdateOne({"vote_id": "v1"}, {"$set": {}}, upsert=True))
+        for i in range(430):
+            op = UpdateOne({"vote_id": "v1", "bioguide_id": str(i)}, {"$set": {}}, upsert=True)
+            await ingester.queue_write("politician_votes", op, is_item=False)
+        await ingester.flush_writes()
+    
+    asyncio.run(run())
+    
+    assert ingester.stats["inserted"] == 1
+    assert ingester.stats["errors"] == 0
+
+
+class _DuplicateKeyCollection:
+    """Collection whose bulk_write fails every op with a duplicate key."""
+    
+    def __init__(self, key_pattern: dict):
+        self.key_pattern = key_pattern
+    
+    async def bulk_write(self, ops, ordered=True):
+        errors = [
+            {"index": i, "code": DUPLICATE_KEY_ERROR, "keyPattern": self.key_pattern}
+            for i in range(len(ops))
+        ]
+        raise BulkWriteError({"writeErrors": errors, "nUpserted": 0, "nModified": 0})
+
+
+def _upsert_unchanged(key_pattern: dict) -> dict:
+    ingester = _ingester(_DuplicateKeyCollection(key_pattern))
+    
+    async def run():
+        await ingester.queue_upsert_if_changed("votes", {"vote_id": "v1"}, {"vote_id": "v1"})
+        await ingester.flush_writes()
+    
+    asyncio.run(run())
+    return ingester.stats
+
+
+def test_duplicate_on_guard_key_counts_as_unchanged():
+    stats = _upsert_unchanged({"vote_id": 1})
+    
+    assert stats["unchanged"] == 1
+    assert stats["errors"] == 0
+
+
+def test_duplicate_on_other_unique_index_counts_as_error():
+    stats = _upsert_unchanged({"chamber": 1, "congress": 1, "roll_number": 1})
+    
+    assert stats["unchanged"] == 0
+    assert stats["errors"] == 1
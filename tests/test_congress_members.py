@@ -0,0 +1,20 @@
+"""Tests for Congress.gov member normalization."""
+import pytest
+
+from src.ingestion.congress_members import _party_from_name
+from src.models.politician import Party
+
+
+@pytest.mark.parametrize("party_name, party", [
+    ("Republican", Party.REPUBLICAN),
+    ("Democratic", Party.DEMOCRAT),
+    ("Independent", Party.INDEPENDENT),
+    ("Independent Democrat", Party.DEMOCRAT),
+    ("Independent Republican", Party.REPUBLICAN),
+    ("Democratic-Farmer-Labor", Party.DEMOCRAT),
+    ("Libertarian", Party.OTHER),
+    ("Ditto", Party.OTHER),
+    ("", Party.OTHER),
+])
+def test_party_from_name(party_name, party):
+    assert _party_from_name(party_name) == party
@@ -0,0 +1,27 @@
+"""Tests for FEC contribution transforms."""
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+from src.ingestion.fec import FECIngester
+
+RAW = {
+    "sub_id": "4123",
+    "candidate_name": "LEE, MIKE",
+    "contributor_name": "SMITH, JOHN",
+    "entity_type": "IND",
+    "committee_id": "C00401224",
+    "contributor_state": "UT",
+    "contribution_receipt_amount": 2500.5,
+    "contribution_receipt_date": "2024-03-15T00:00:00",
+    "two_year_transaction_period": 2024,
+}
+
+
+def test_transform_returns_validated_contribution():
+    contribution = asyncio.run(FECIngester().transform(dict(RAW)))
+    
+    assert isinstance(contribution.amount, Decimal)
+    assert contribution.amount == Decimal("2500.5")
+    assert contribution.contribution_date == date(2024, 3, 15)
+    assert contribution.id == "fec_4123"
@@ -0,0 +1,44 @@
+"""Tests for the shared HTTP helpers."""
+import asyncio
+
+import httpx
+import pytest
+
+from src.ingestion import http_client
+from src.ingestion.http_client import iter_json_items
+
+
+def _streamed_response(*chunks: bytes) -> httpx.Response:
+    """Response whose body arrives in the given chunks."""
+    async def body():
+        for chunk in chunks:
+            yield chunk
+    
+    return httpx.Response(200, content=body())
+
+
+def _collect(response: httpx.Response, prefix: str) -> list:
+    async def run():
+        return [item async for item in iter_json_items(response, prefix)]
+    
+    return asyncio.run(run())
+
+
+@pytest.mark.skipif(not http_client.IJSON_AVAILABLE, reason="ijson not installed")
+def test_iter_json_items_streams_across_chunks():
+    response = _streamed_response(
+        b'{"pagination": {"pages": 3}, "res',
+        b'ults": [{"id": "1-0"}, {"id": "1',
+        b'-1"}, {"id": "1-2", "amount": 12.5}]}',
+    )
+    
+    items = _collect(response, "results.item")
+    
+    assert items == [{"id": "1-0"}, {"id": "1-1"}, {"id": "1-2", "amount": 12.5}]
+
+
+def test_iter_json_items_without_ijson(monkeypatch):
+    monkeypatch.setattr(http_client, "IJSON_AVAILABLE", False)
+    response = _streamed_response(b'{"results": [{"id": 1},', b' {"id": 2}]}')
+    
+    assert _collect(response, "results.item") == [{"id": 1}, {"id": 2}]